@@ -4,32 +4,13 @@ Interface moderna e responsiva com tema dark profissional.
 """
 
 import logging
+from functools import partial
+from importlib import import_module
+
 import customtkinter as ctk
-from tkinter import ttk, messagebox
 
-from src.config.settings import API_BASE_URL, THEME_MODE, THEME_COLOR
+from src.config.settings import API_BASE_URL
 from src.models.api_client import APIClient
-from src.views.telas_consultas import (
-    tela_consulta_por_nome,
-    tela_consulta_por_estado,
-    tela_consulta_livro,
-)
-from src.views.telas_cadastro import (
-    tela_cadastro_cliente,
-    tela_cadastro_livro,
-)
-from src.views.telas_reservas import (
-    tela_nova_reserva,
-    tela_listar_reservas,
-    tela_devolucao_reserva,
-    tela_consultar_reservas,
-    tela_editar_reserva,
-    tela_cancelar_reserva,
-    tela_finalizar_reserva,
-    tela_editar_cliente_da_reserva,
-    tela_editar_livro_da_reserva
-)
-from src.views.telas_multas import tela_menu_multas
 
 # ==================== Configuração ====================
 logging.basicConfig(
@@ -38,16 +19,83 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("blue")
+# set_default_color_theme relê o JSON do tema: aplica só uma vez por processo,
+# mesmo que este módulo seja reimportado (testes, reload).
+if not getattr(ctk, "_biblioteca_tema_aplicado", False):
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+    ctk._biblioteca_tema_aplicado = True
+
+# Módulo de origem de cada tela referenciada nas especificações de menu.
+# Os módulos de views só são importados no primeiro clique que precisa deles.
+_MODULOS_TELAS = {
+    'tela_consulta_por_nome': 'src.views.telas_consultas',
+    'tela_consulta_por_estado': 'src.views.telas_consultas',
+    'tela_consulta_livro': 'src.views.telas_consultas',
+    'tela_cadastro_cliente': 'src.views.telas_cadastro',
+    'tela_cadastro_livro': 'src.views.telas_cadastro',
+    'tela_nova_reserva': 'src.views.telas_reservas',
+    'tela_consultar_reservas': 'src.views.telas_reservas',
+    'tela_editar_reserva': 'src.views.telas_reservas',
+    'tela_finalizar_reserva': 'src.views.telas_reservas',
+    'tela_cancelar_reserva': 'src.views.telas_reservas',
+    'tela_devolucao_reserva': 'src.views.telas_reservas',
+    'tela_editar_cliente_da_reserva': 'src.views.telas_reservas',
+    'tela_editar_livro_da_reserva': 'src.views.telas_reservas',
+    'tela_menu_multas': 'src.views.telas_multas',
+}
+
+
+def _carregar_tela(nome_funcao: str):
+    """Importar (na primeira vez) o módulo da tela e retornar a função."""
+    return getattr(import_module(_MODULOS_TELAS[nome_funcao]), nome_funcao)
 
 
 class BibliotecaApp:
     """Aplicação principal com interface moderna."""
 
-    def __init__(self):
-        """Inicializar aplicação."""
-        self.janela = ctk.CTk()
+    # Botões da tela inicial: (texto, método, chave de cor em self.cores)
+    _BOTOES_INICIAL = (
+        ("🔍 CONSULTAS", "menu_consultas", "accent"),
+        ("➕ CADASTROS", "menu_cadastros", "verde"),
+        ("📚 RESERVAS", "menu_reservas", "accent"),
+        ("💰 MULTAS", "menu_multas", "laranja"),
+        ("❌ SAIR", "sair", "vermelho"),
+    )
+
+    # Opções dos menus: (texto, função de tela, argumentos extras)
+    _OPCOES_CONSULTAS = (
+        ("👤 Cliente por Nome", "tela_consulta_por_nome", {}),
+        ("🗺️ Clientes por Estado", "tela_consulta_por_estado", {}),
+        ("📖 Livro por Nome", "tela_consulta_livro", {"tipo": "nome"}),
+        ("✍️ Livros por Autor", "tela_consulta_livro", {"tipo": "autor"}),
+        ("🎭 Livros por Gênero", "tela_consulta_livro", {"tipo": "genero"}),
+    )
+
+    _OPCOES_CADASTROS = (
+        ("👤 Novo Cliente", "tela_cadastro_cliente", {}),
+        ("📚 Novo Livro", "tela_cadastro_livro", {}),
+        ("✏️ Atualizar Cliente (via Reserva)", "tela_editar_cliente_da_reserva", {}),
+        ("✏️ Atualizar Livro (via Reserva)", "tela_editar_livro_da_reserva", {}),
+    )
+
+    _OPCOES_RESERVAS = (
+        ("📅 Nova Reserva", "tela_nova_reserva", {}),
+        ("📋 Consultar Reservas", "tela_consultar_reservas", {}),
+        ("⚙️ Ajustar Reserva", "tela_editar_reserva", {}),
+        ("✅ Finalizar Reserva", "tela_finalizar_reserva", {}),
+        ("❌ Cancelar Reserva", "tela_cancelar_reserva", {}),
+        ("📦 Registrar Devolução", "tela_devolucao_reserva", {}),
+    )
+
+    def __init__(self, master=None):
+        """Inicializar aplicação.
+
+        Args:
+            master: Janela raiz já existente. Se informada, a aplicação abre
+                em um CTkToplevel dela, no mesmo processo (launcher multi-instância).
+        """
+        self.janela = ctk.CTk() if master is None else ctk.CTkToplevel(master)
         self.janela.title("📚 Sistema de Biblioteca")
         self.janela.geometry("1000x700")
         self.janela.minsize(800, 600)
@@ -66,67 +114,167 @@ class BibliotecaApp:
             'verde_hover': '#34d399',
             'vermelho': '#ef4444',
             'vermelho_hover': '#f87171',
+            'laranja': '#f59e0b',
+            'laranja_hover': '#fbbf24',
         }
         
         self.janela.configure(fg_color=self.cores['bg_principal'])
+
+        # Fontes compartilhadas por todos os widgets (criadas uma única vez)
+        self.fontes = {
+            'titulo_grande': ctk.CTkFont(family="Arial Black", size=40, weight="bold"),
+            'titulo_medio': ctk.CTkFont(family="Arial Black", size=28, weight="bold"),
+            'botao_grande': ctk.CTkFont(family="Arial", size=18, weight="bold"),
+            'botao_medio': ctk.CTkFont(family="Arial", size=16, weight="bold"),
+            'subtitulo': ctk.CTkFont(family="Arial", size=14),
+            'voltar': ctk.CTkFont(family="Arial", size=12),
+        }
+
+        # Container persistente: só o conteúdo interno é trocado na navegação.
+        # A janela tem geometria fixa; trocar telas não deve recalcular seu tamanho.
+        self.janela.pack_propagate(False)
+        self.conteudo = ctk.CTkFrame(self.janela, fg_color=self.cores['bg_principal'], corner_radius=0)
+        self.conteudo.pack(fill="both", expand=True)
+
+        # Área onde os módulos de views desenham (e limpam) suas telas
+        self._area_telas = ctk.CTkFrame(self.conteudo, fg_color=self.cores['bg_principal'], corner_radius=0)
+
+        # Frame exibido no momento (tela inicial, menu padrão ou área de telas)
+        self._tela_atual = None
+
+        # Menu padrão único: título e botões (pool) reconfigurados a cada menu
+        self._menu_padrao = None
+        self._menu_titulo = None
+        self._menu_container = None
+        self._pool_botoes = []
+        self._menu_atual = None
+        self._opcoes_menus = {}
+
+        # Debounce do redimensionamento: só o último <Configure> é processado
+        self._redimensionar_after = None
+        self._ultima_geometria = None
+        self.janela.bind("<Configure>", self._ao_configurar, add="+")
+        
+        # Diálogo de mensagens reaproveitado (oculto até ser necessário)
+        self._construir_dialogo()
+
+        # Tela inicial é a mais visitada (todo "Voltar" leva a ela): pré-construída
+        self._tela_inicial = self._construir_tela_inicial()
         
         logger.info("✅ Aplicação inicializada")
         self.tela_inicial()
 
+    def _ao_configurar(self, event):
+        """Agendar o relayout da janela após o fim da rajada de <Configure>."""
+        # Os bindtags dos filhos incluem a janela; interessa só a própria janela
+        if event.widget is not self.janela:
+            return
+        if self._redimensionar_after is not None:
+            self.janela.after_cancel(self._redimensionar_after)
+        self._redimensionar_after = self.janela.after(50, self._redimensionar)
+
+    def _redimensionar(self):
+        """Aplicar o layout pendente uma única vez, se a geometria mudou."""
+        self._redimensionar_after = None
+        geometria = (self.janela.winfo_width(), self.janela.winfo_height())
+        if geometria == self._ultima_geometria:
+            return
+        self._ultima_geometria = geometria
+        self.janela.update_idletasks()
+
     def limpar_janela(self):
-        """Limpar todos os widgets da janela."""
-        for widget in self.janela.winfo_children():
+        """Limpar os widgets da área de telas dos módulos."""
+        for widget in self._area_telas.winfo_children():
             widget.destroy()
 
+    def _trocar_para(self, tela):
+        """Ocultar a tela atual e exibir a informada."""
+        atual = self._tela_atual
+        if atual is not None and atual is not tela:
+            atual.pack_forget()
+            if atual is self._area_telas:
+                self.limpar_janela()
+
+        tela.pack(fill="both", expand=True)
+        self._tela_atual = tela
+
+    def _mostrar_menu(self, nome: str, titulo: str, especificacao: tuple, callback_voltar):
+        """Exibir o menu padrão preenchido com as opções do menu informado."""
+        construido = self._menu_padrao is None
+        if construido:
+            self._menu_padrao = self._criar_menu_padrao()
+
+        if nome != self._menu_atual:
+            opcoes = self._opcoes_menus.get(nome)
+            if opcoes is None:
+                opcoes = self._opcoes_menus[nome] = self._opcoes_menu(especificacao, callback_voltar)
+            self._preencher_menu_padrao(titulo, opcoes)
+            self._menu_atual = nome
+
+        self._trocar_para(self._menu_padrao)
+        if construido:
+            # Layout do menu recém-construído resolvido numa única passada
+            self.janela.update_idletasks()
+
+    def _abrir_tela(self, funcao, callback_voltar, **kwargs):
+        """Abrir tela de um módulo de views na área dedicada."""
+        self._trocar_para(self._area_telas)
+        funcao(self._area_telas, self.api_client, callback_voltar, **kwargs)
+
+    def _abrir_tela_por_nome(self, nome_funcao: str, callback_voltar, **kwargs):
+        """Carregar sob demanda o módulo da tela e abri-la."""
+        # Navegação é caminho quente: só formata a mensagem se DEBUG estiver ativo
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Abrindo tela %s", nome_funcao)
+        self._abrir_tela(_carregar_tela(nome_funcao), callback_voltar, **kwargs)
+
     def tela_inicial(self):
-        """Tela inicial com menu principal."""
-        self.limpar_janela()
-        
+        """Tela inicial com menu principal (apenas reexibe o frame pronto)."""
+        self._trocar_para(self._tela_inicial)
+
+    def _construir_tela_inicial(self):
+        """Construir frame da tela inicial."""
+        cores, fontes = self.cores, self.fontes
+        bg, bg2 = cores['bg_principal'], cores['bg_secundario']
+        tela = ctk.CTkFrame(self.conteudo, fg_color=bg, corner_radius=0)
+
         # Header
-        header = ctk.CTkFrame(self.janela, fg_color=self.cores['bg_secundario'], height=120)
+        header = ctk.CTkFrame(tela, fg_color=bg2, height=120)
         header.pack(fill="x", padx=0, pady=0)
         header.pack_propagate(False)
         
         titulo = ctk.CTkLabel(
             header,
             text="📚 Sistema de Biblioteca",
-            font=("Arial Black", 40, "bold"),
-            text_color=self.cores['accent']
+            font=fontes['titulo_grande'],
+            text_color=cores['accent']
         )
         titulo.pack(pady=20)
         
         subtitulo = ctk.CTkLabel(
             header,
             text="Gerenciamento Moderno e Eficiente",
-            font=("Arial", 14),
-            text_color=self.cores['text_secundario']
+            font=fontes['subtitulo'],
+            text_color=cores['text_secundario']
         )
         subtitulo.pack()
         
         # Container de botões
-        container = ctk.CTkFrame(self.janela, fg_color=self.cores['bg_principal'])
+        container = ctk.CTkFrame(tela, fg_color=bg)
         container.pack(fill="both", expand=True, padx=40, pady=40)
         
         # Grid de botões (3x2)
-        botoes = [
-            ("🔍 CONSULTAS", self.menu_consultas, self.cores['accent'], self.cores['accent_hover']),
-            ("➕ CADASTROS", self.menu_cadastros, self.cores['verde'], self.cores['verde_hover']),
-            ("📚 RESERVAS", self.menu_reservas, self.cores['accent'], self.cores['accent_hover']),
-            ("💰 MULTAS", self.menu_multas, "#f59e0b", "#fbbf24"),
-            ("❌ SAIR", self.janela.destroy, self.cores['vermelho'], self.cores['vermelho_hover']),
-        ]
-        
-        for idx, (texto, cmd, cor, cor_hover) in enumerate(botoes):
+        for idx, (texto, metodo, cor) in enumerate(self._BOTOES_INICIAL):
             linha = idx // 2
             coluna = idx % 2
             
             btn = ctk.CTkButton(
                 container,
                 text=texto,
-                command=cmd,
-                font=("Arial", 18, "bold"),
-                fg_color=cor,
-                hover_color=cor_hover,
+                command=getattr(self, metodo),
+                font=fontes['botao_grande'],
+                fg_color=cores[cor],
+                hover_color=cores[f'{cor}_hover'],
                 height=120,
                 corner_radius=15,
                 text_color="white"
@@ -140,70 +288,63 @@ class BibliotecaApp:
         container.grid_columnconfigure(0, weight=1)
         container.grid_columnconfigure(1, weight=1)
 
+        return tela
+
     def menu_consultas(self):
         """Menu de consultas."""
-        self.limpar_janela()
-        self._criar_menu_padrao(
-            "🔍 CONSULTAS",
-            [
-                ("👤 Cliente por Nome", lambda: tela_consulta_por_nome(self.janela, self.api_client, self.menu_consultas)),
-                ("🗺️ Clientes por Estado", lambda: tela_consulta_por_estado(self.janela, self.api_client, self.menu_consultas)),
-                ("📖 Livro por Nome", lambda: tela_consulta_livro(self.janela, self.api_client, self.menu_consultas, tipo="nome")),
-                ("✍️ Livros por Autor", lambda: tela_consulta_livro(self.janela, self.api_client, self.menu_consultas, tipo="autor")),
-                ("🎭 Livros por Gênero", lambda: tela_consulta_livro(self.janela, self.api_client, self.menu_consultas, tipo="genero")),
-            ]
-        )
+        self._mostrar_menu("consultas", "🔍 CONSULTAS", self._OPCOES_CONSULTAS, self.menu_consultas)
 
     def menu_cadastros(self):
         """Menu de cadastros."""
-        self.limpar_janela()
-        self._criar_menu_padrao(
-            "➕ CADASTROS",
-            [
-                ("👤 Novo Cliente", lambda: tela_cadastro_cliente(self.janela, self.api_client, self.menu_cadastros)),
-                ("📚 Novo Livro", lambda: tela_cadastro_livro(self.janela, self.api_client, self.menu_cadastros)),
-                ("✏️ Atualizar Cliente (via Reserva)", lambda: tela_editar_cliente_da_reserva(self.janela, self.api_client, self.menu_cadastros)),
-                ("✏️ Atualizar Livro (via Reserva)", lambda: tela_editar_livro_da_reserva(self.janela, self.api_client, self.menu_cadastros)),
-            ]
-        )
+        self._mostrar_menu("cadastros", "➕ CADASTROS", self._OPCOES_CADASTROS, self.menu_cadastros)
 
     def menu_reservas(self):
         """Menu de reservas."""
-        self.limpar_janela()
-        self._criar_menu_padrao(
-            "📚 RESERVAS",
-            [
-                ("📅 Nova Reserva", lambda: tela_nova_reserva(self.janela, self.api_client, self.menu_reservas)),
-                ("📋 Consultar Reservas", lambda: tela_consultar_reservas(self.janela, self.api_client, self.menu_reservas)),
-                ("⚙️ Ajustar Reserva", lambda: tela_editar_reserva(self.janela, self.api_client, self.menu_reservas)),
-                ("✅ Finalizar Reserva", lambda: tela_finalizar_reserva(self.janela, self.api_client, self.menu_reservas)),
-                ("❌ Cancelar Reserva", lambda: tela_cancelar_reserva(self.janela, self.api_client, self.menu_reservas)),
-                ("📦 Registrar Devolução", lambda: tela_devolucao_reserva(self.janela, self.api_client, self.menu_reservas)),
-            ]
-        )
+        self._mostrar_menu("reservas", "📚 RESERVAS", self._OPCOES_RESERVAS, self.menu_reservas)
+
     def menu_multas(self):
         """Menu de multas."""
         # Redireciona para o módulo de multas (já implementado)
-        tela_menu_multas(self.janela, self.api_client, self.tela_inicial)
+        self._abrir_tela_por_nome('tela_menu_multas', self.tela_inicial)
+
+    def sair(self):
+        """Encerrar a aplicação."""
+        self.janela.destroy()
+
+    def _opcoes_menu(self, especificacao: tuple, callback_voltar) -> list:
+        """Converter especificação estática de menu em pares (texto, comando)."""
+        return [
+            (texto, self._comando_tela(nome_funcao, callback_voltar, extras))
+            for texto, nome_funcao, extras in especificacao
+        ]
+
+    def _comando_tela(self, nome_funcao: str, callback_voltar, extras: dict):
+        """Criar comando de botão que abre a tela informada."""
+        return partial(self._abrir_tela_por_nome, nome_funcao, callback_voltar, **extras)
+
+    def _criar_menu_padrao(self):
+        """Criar frame do menu padrão (título e opções preenchidos depois)."""
+        cores, fontes = self.cores, self.fontes
+        bg, bg2 = cores['bg_principal'], cores['bg_secundario']
+        acc, acc_h = cores['accent'], cores['accent_hover']
+        tela = ctk.CTkFrame(self.conteudo, fg_color=bg, corner_radius=0)
 
-    def _criar_menu_padrao(self, titulo: str, opcoes: list):
-        """Criar menu padrão com opções."""
         # Header com botão voltar
-        header = ctk.CTkFrame(self.janela, fg_color=self.cores['bg_secundario'], height=100)
+        header = ctk.CTkFrame(tela, fg_color=bg2, height=100)
         header.pack(fill="x", padx=0, pady=0)
         header.pack_propagate(False)
         
-        top_frame = ctk.CTkFrame(header, fg_color=self.cores['bg_secundario'])
+        top_frame = ctk.CTkFrame(header, fg_color=bg2)
         top_frame.pack(fill="x", padx=20, pady=10)
         
         btn_voltar = ctk.CTkButton(
             top_frame,
             text="⬅️ Voltar",
             command=self.tela_inicial,
-            font=("Arial", 12),
+            font=fontes['voltar'],
             fg_color="transparent",
-            hover_color=self.cores['accent_hover'],
-            text_color=self.cores['accent'],
+            hover_color=acc_h,
+            text_color=acc,
             width=100,
             height=35,
             corner_radius=8
@@ -212,38 +353,101 @@ class BibliotecaApp:
         
         titulo_label = ctk.CTkLabel(
             header,
-            text=titulo,
-            font=("Arial Black", 28, "bold"),
-            text_color=self.cores['accent']
+            text="",
+            font=fontes['titulo_medio'],
+            text_color=acc
         )
         titulo_label.pack(fill="x", padx=20, pady=10)
         
         # Container de opções
-        container = ctk.CTkFrame(self.janela, fg_color=self.cores['bg_principal'])
+        container = ctk.CTkFrame(tela, fg_color=bg)
         container.pack(fill="both", expand=True, padx=40, pady=40)
         
+        # Grid em coluna única: todas as opções entram numa só passada de layout
+        container.grid_columnconfigure(0, weight=1)
+
+        self._menu_titulo = titulo_label
+        self._menu_container = container
+        return tela
+
+    def _preencher_menu_padrao(self, titulo: str, opcoes: list):
+        """Aplicar título e opções ao menu padrão, reaproveitando os botões do pool."""
+        self._menu_titulo.configure(text=titulo)
+
+        pool = self._pool_botoes
         for idx, (texto, cmd) in enumerate(opcoes):
-            btn = ctk.CTkButton(
-                container,
-                text=texto,
-                command=cmd,
-                font=("Arial", 16, "bold"),
-                fg_color=self.cores['accent'],
-                hover_color=self.cores['accent_hover'],
-                height=60,
-                corner_radius=10,
-                text_color="white"
-            )
-            btn.pack(fill="x", pady=12)
+            if idx < len(pool):
+                btn = pool[idx]
+                btn.configure(text=texto, command=cmd)
+            else:
+                btn = ctk.CTkButton(
+                    self._menu_container,
+                    text=texto,
+                    command=cmd,
+                    font=self.fontes['botao_medio'],
+                    fg_color=self.cores['accent'],
+                    hover_color=self.cores['accent_hover'],
+                    height=60,
+                    corner_radius=10,
+                    text_color="white"
+                )
+                pool.append(btn)
+            btn.grid(row=idx, column=0, sticky="ew", pady=12)
+
+        # Botões excedentes ficam ocultos para o próximo menu maior
+        for btn in pool[len(opcoes):]:
+            btn.grid_forget()
+
+    def _construir_dialogo(self):
+        """Construir uma única vez o diálogo modal usado por mostrar_mensagem."""
+        self._dialogo = ctk.CTkToplevel(self.janela)
+        self._dialogo.withdraw()
+        self._dialogo.resizable(False, False)
+        self._dialogo.transient(self.janela)
+        self._dialogo.configure(fg_color=self.cores['bg_secundario'])
+        self._dialogo.protocol("WM_DELETE_WINDOW", self._fechar_dialogo)
+
+        self._dialogo_label = ctk.CTkLabel(
+            self._dialogo,
+            text="",
+            font=self.fontes['subtitulo'],
+            text_color=self.cores['text'],
+            wraplength=360
+        )
+        self._dialogo_label.pack(padx=30, pady=(25, 15))
+
+        self._dialogo_botao = ctk.CTkButton(
+            self._dialogo,
+            text="OK",
+            command=self._fechar_dialogo,
+            font=self.fontes['botao_medio'],
+            width=120,
+            height=40,
+            corner_radius=8,
+            text_color="white"
+        )
+        self._dialogo_botao.pack(pady=(0, 20))
+
+    def _fechar_dialogo(self):
+        """Ocultar o diálogo de mensagens sem destruí-lo."""
+        self._dialogo.grab_release()
+        self._dialogo.withdraw()
 
     def mostrar_mensagem(self, titulo: str, mensagem: str, tipo: str = "info"):
-        """Exibir mensagem simples via messagebox."""
-        if tipo == "erro":
-            messagebox.showerror(titulo, mensagem)
-        elif tipo == "aviso":
-            messagebox.showwarning(titulo, mensagem)
-        else:
-            messagebox.showinfo(titulo, mensagem)
+        """Exibir mensagem simples no diálogo modal reaproveitado."""
+        cor = {'erro': 'vermelho', 'aviso': 'laranja'}.get(tipo, 'accent')
+
+        self._dialogo.title(titulo)
+        self._dialogo_label.configure(text=mensagem)
+        self._dialogo_botao.configure(
+            fg_color=self.cores[cor],
+            hover_color=self.cores[f'{cor}_hover']
+        )
+
+        self._dialogo.deiconify()
+        self._dialogo.lift()
+        self._dialogo.grab_set()
+        self._dialogo_botao.focus_set()
 
     def executar(self):
         """Executar aplicação (loop principal)."""
@@ -259,7 +463,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("⚠️ Aplicação interrompida pelo usuário")
     except Exception as e:
-        logger.error(f"❌ Erro fatal: {e}")
+        logger.error("❌ Erro fatal: %s", e)
         raise
 
 
@@ -10,16 +10,28 @@ Data: 2025
 Versão: 3.0 (Refatorada)
 """
 
+import atexit
 import json
 import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 
 import customtkinter as ctk
-import requests
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+try:
+    import orjson
+
+    _decodificar_json = orjson.loads
+except ImportError:  # orjson é opcional; json da stdlib aceita bytes também
+    _decodificar_json = json.loads
+
 # ==================== Configuração de Logging ====================
 logging.basicConfig(
     level=logging.INFO,
@@ -30,7 +42,11 @@ logger = logging.getLogger(__name__)
 # ==================== Constantes Globais ====================
 # Configuração da API
 API_BASE_URL = "http://localhost:3000"
-API_TIMEOUT = 10  # segundos
+API_CONNECT_TIMEOUT = 2  # segundos para abrir a conexão (falha rápido se a API caiu)
+API_READ_TIMEOUT = 10  # segundos aguardando a resposta
+API_TIMEOUT = (API_CONNECT_TIMEOUT, API_READ_TIMEOUT)
+CACHE_TTL_S = 60  # validade das respostas GET em cache
+CACHE_MAX_ITENS = 256
 
 # Configuração de temas
 THEME_MODE = "light"
@@ -62,12 +78,164 @@ GENEROS: List[Tuple[int, str]] = [
     (15, "Didático"),
 ]
 
+# Índices dos gêneros calculados uma vez na importação
+GENERO_POR_ID: Dict[int, str] = {id_genero: nome for id_genero, nome in GENEROS}
+GENERO_POR_NOME: Dict[str, int] = {nome.lower(): id_genero for id_genero, nome in GENEROS}
+LISTA_GENEROS_NOMES: Tuple[str, ...] = tuple(nome for _, nome in GENEROS)
+
 # Configurações de GUI
 WINDOW_TIMEOUT_MS = 100
+INTERVALO_VERIFICACAO_MS = 30  # intervalo de checagem das requisições em segundo plano
 DATE_FORMAT = "%d/%m/%Y"
 
+# Pré-validação barata de datas DD/MM/YYYY antes de recorrer ao strptime
+_DATA_RE = re.compile(r"([0-3]\d)/([01]\d)/(\d{4})")
+
+# Tabela de str.translate que remove todo caractere Latin-1 que não é dígito
+_TABELA_SO_DIGITOS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(256) if not chr(c).isdigit())
+)
+
+# Bindtag dos campos de data formatados ao perder o foco
+_BINDTAG_DATA = "EntradaData"
+
+# ==================== Menus ====================
+def _montar_botoes(base: Dict[str, Any], linhas: List[Tuple]) -> Tuple:
+    """Mesclar as opções comuns em cada botão uma única vez, na importação."""
+    return tuple(
+        ({**base, "text": texto, "hover_color": cor_hover}, y_pos, destino)
+        for texto, cor_hover, y_pos, destino in linhas
+    )
+
+
+# Botões de cada menu: (opções do CTkButton, posição y, nome da tela de
+# destino). O destino é resolvido no clique, pois as telas vêm mais abaixo.
+_BOTOES_INICIAL = _montar_botoes(
+    {"fg_color": COLOR_PRIMARY, "text_color": COLOR_TEXT},
+    [
+        ("Consulta", "#9CAD84", 150, "pri_consulta"),
+        ("Cadastro", "#B36A5E", 185, "pri_cadastro"),
+        ("Reservas", "#5F8D96", 220, "pri_reserva"),
+        ("Exclusão", "#7C5E67", 255, "pri_exclusao"),
+    ],
+)
+
+_BOTOES_CONSULTA = _montar_botoes(
+    {"fg_color": COLOR_PRIMARY},
+    [
+        ("Nome Usuário", "#5F8D96", 140, "sec_consulta_nomeusuario"),
+        ("Por Estado", "#9CAD84", 170, "sec_consulta_estado"),
+        ("Nome Livro", "#B36A5E", 200, "sec_consulta_nomelivro"),
+        ("Nome Autor", "#7C5E67", 230, "sec_consulta_nomeautor"),
+        ("Por Gênero", "#ADA584", 260, "sec_consulta_genero"),
+    ],
+)
+
+_BOTOES_CADASTRO = _montar_botoes(
+    {"fg_color": COLOR_PRIMARY},
+    [
+        ("Cadastro Cliente", "#5F8D96", 150, "sec_cadastro_usuario"),
+        ("Cadastro Livro", "#9CAD84", 185, "sec_cadastro_livro"),
+    ],
+)
+
+_BOTOES_RESERVA = _montar_botoes(
+    {"fg_color": COLOR_PRIMARY},
+    [
+        ("Consultar Reservas", "#1B263B", 150, None),
+        ("Nova Reserva", "#A0522D", 185, "sec_nova_reserva"),
+    ],
+)
+
+# ==================== Botões ====================
+# Opções de cada estilo de botão, montadas uma única vez na importação e
+# compartilhadas por todos os botões criados com criar_botao.
+_FONTE_SUBLINHADA = ("Arial", 14, "underline")
+
+_ESTILOS_BOTAO: Dict[str, Dict[str, Any]] = {
+    "padrao": {},
+    "sair": {"fg_color": COLOR_PRIMARY, "hover_color": COLOR_ERROR},
+    "voltar": {
+        "text_color": "black",
+        "fg_color": "#6D7B74",
+        "hover_color": "#55635C",
+        "font": _FONTE_SUBLINHADA,
+    },
+    "voltar_resultado": {
+        "text_color": "white",
+        "fg_color": "#000000",
+        "hover_color": "#575757",
+        "font": _FONTE_SUBLINHADA,
+    },
+    "voltar_formulario": {"font": _FONTE_SUBLINHADA},
+}
+
+# ==================== Formulários ====================
+# Campos das telas de cadastro/reserva: (rótulo, nome do entry[, só inteiros])
+_CAMPOS_LIVRO = (
+    ("Digite o Autor/a:", "entry_autor"),
+    ("Digite o Nome do Livro:", "entry_nomelivro"),
+    ("Digite a Editora:", "entry_nomeeditora"),
+)
+
+_CAMPOS_USUARIO = (
+    ("Digite o Nome:", "entry_nome"),
+    ("Digite o Sobrenome:", "entry_sobrenome"),
+    ("Digite o CPF:", "entry_cpf"),
+    ("Digite a Data de Nascimento:", "entry_datanascimento"),
+    ("Digite a Data de Afiliação:", "entry_dataafiliacao"),
+    ("Digite o CEP:", "entry_cep"),
+    ("Digite a Rua:", "entry_rua"),
+    ("Digite o Número:", "entry_numero"),
+    ("Digite o Bairro:", "entry_bairro"),
+    ("Digite a Cidade:", "entry_cidade"),
+    ("Digite o Estado:", "entry_estado"),
+    ("Digite o Complemento (Se Tiver):", "entry_complemento"),
+)
+
+_CAMPOS_RESERVA = (
+    ("Digite o CPF:", "entry_cpfreserva", False),
+    ("Digite o Nome do Livro:", "entry_nomelivro", False),
+    ("Digite a Quantidade:", "entry_qntdlivro", True),
+    ("Digite a Data da Retirada:", "entry_dataretirada", False),
+    ("Digite a Data Prevista para Volta:", "entry_datavolta", False),
+    ("Digite a forma de retirada:", "entry_retirada", False),
+    ("Observação da Reserva:", "entry_observacao", False),
+)
+
 # ==================== Variáveis Globais ====================
-after_ids: List[int] = []  # Lista para armazenar os IDs de after para limpeza
+# Timers (after) pendentes por widget: id(widget) -> ids do after.
+# Cada timer sai do conjunto ao disparar; ver agendar_after/cancelar_timers.
+_timers: Dict[int, Set[str]] = defaultdict(set)
+
+# Sessão HTTP compartilhada: reaproveita conexões TCP entre requisições.
+# requests só é importado na primeira requisição (ver _obter_sessao).
+METODOS_HTTP = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
+
+requests: Any = None
+_SESSION: Any = None
+_sessao_lock = threading.Lock()
+
+# Executor para tirar as requisições da thread do Tk
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="biblioteca-api")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+# Cache das respostas GET: chave -> (expira_em, dados)
+_cache_respostas: Dict[Tuple, Tuple[float, Any]] = {}
+_cache_lock = threading.Lock()
+
+# Tags das linhas alternadas da tabela, indexadas por i & 1
+_TAGS = ("oddrow", "evenrow")
+_CORES_TAGS = {"oddrow": "#1a1a1a", "evenrow": "#2a2a2a"}
+
+# Janela raiz única e a tela (frame) exibida nela
+_raiz: Optional["CustomCTk"] = None
+_tela_atual: Optional[ctk.CTkFrame] = None
+# Tela montada mas ainda não exibida: (frame, título, geometria)
+_tela_pendente: Optional[Tuple[ctk.CTkFrame, str, str]] = None
+
+# Estilo da Treeview já configurado (um por interpretador Tcl)
+_estilo_treeview: Optional[ttk.Style] = None
 
 # ==================== Configuração do CustomTkinter ====================
 ctk.set_appearance_mode(THEME_MODE)
@@ -83,19 +251,67 @@ class CustomCTk(ctk.CTk):
     os timers (after) sejam cancelados antes de destruir a janela.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Escala fixa definida uma vez, antes de qualquer widget ser desenhado
+        self.tk.call("tk", "scaling", 1.0)
+        self._validador_inteiros: Optional[str] = None
+        # Formatação de data ligada uma vez à classe; os campos de data só
+        # recebem a bindtag (ver marcar_entrada_data)
+        self.bind_class(_BINDTAG_DATA, "<FocusOut>", formatar_data_entrada)
+
+    def obter_validador_inteiros(self) -> str:
+        """Retornar o comando Tcl de validar_somente_inteiros, registrado uma vez."""
+        if self._validador_inteiros is None:
+            self._validador_inteiros = self.register(validar_somente_inteiros)
+        return self._validador_inteiros
+
     def destroy(self) -> None:
         """Destruir janela cancelando todos os timers ativos."""
-        global after_ids
-        for timer_id in after_ids:
-            try:
-                self.after_cancel(timer_id)
-            except Exception as e:
-                logger.warning(f"Erro ao cancelar timer {timer_id}: {e}")
-        after_ids.clear()
+        for chave in list(_timers):
+            cancelar_timers(self, chave)
         super().destroy()
 
 
 # ==================== Funções Auxiliares ====================
+def agendar_after(widget: tk.Misc, atraso_ms: int, funcao) -> str:
+    """
+    Agendar funcao com widget.after, registrando o timer para cancelamento.
+
+    Args:
+        widget: Widget dono do timer.
+        atraso_ms: Atraso em milissegundos.
+        funcao: Função sem argumentos a executar.
+
+    Returns:
+        str: Id retornado por after.
+    """
+    pendentes = _timers[id(widget)]
+
+    def executar() -> None:
+        pendentes.discard(timer_id)
+        funcao()
+
+    timer_id = widget.after(atraso_ms, executar)
+    pendentes.add(timer_id)
+    return timer_id
+
+
+def cancelar_timers(widget: tk.Misc, chave: Optional[int] = None) -> None:
+    """
+    Cancelar os timers pendentes registrados para um widget.
+
+    Args:
+        widget: Widget usado para chamar after_cancel.
+        chave: id() do dono dos timers; por padrão o próprio widget.
+    """
+    for timer_id in _timers.pop(id(widget) if chave is None else chave, ()):
+        try:
+            widget.after_cancel(timer_id)
+        except Exception as e:
+            logger.warning(f"Erro ao cancelar timer {timer_id}: {e}")
+
+
 def formatar_data_entrada(event: tk.Event) -> None:
     """
     Formatar entrada de data no formato DD/MM/YYYY automaticamente.
@@ -109,7 +325,10 @@ def formatar_data_entrada(event: tk.Event) -> None:
     try:
         entrada = event.widget
         valor = entrada.get()
-        numeros = "".join(filter(str.isdigit, valor))
+        numeros = valor.translate(_TABELA_SO_DIGITOS)
+        if not numeros.isdigit() and numeros:
+            # Caracteres fora do Latin-1 (raro): cai no filtro caractere a caractere
+            numeros = "".join(filter(str.isdigit, numeros))
 
         novo_valor = ""
         if len(numeros) >= 2:
@@ -119,12 +338,21 @@ def formatar_data_entrada(event: tk.Event) -> None:
         if len(numeros) >= 8:
             novo_valor += "/" + numeros[4:8]
 
-        entrada.delete(0, tk.END)
-        entrada.insert(0, novo_valor)
+        if novo_valor != valor:
+            entrada.delete(0, tk.END)
+            entrada.insert(0, novo_valor)
 
-        # Validar data
+        # Validar data: faixa de dia/mês pelo regex; strptime só quando o
+        # dia pode não existir no mês (29 a 31)
         if len(novo_valor) == 10:
-            datetime.strptime(novo_valor, DATE_FORMAT)
+            m = _DATA_RE.fullmatch(novo_valor)
+            if not m:
+                raise ValueError(novo_valor)
+            dia, mes, ano = map(int, m.groups())
+            if not (1 <= dia <= 31 and 1 <= mes <= 12 and ano >= 1):
+                raise ValueError(novo_valor)
+            if dia > 28:
+                datetime.strptime(novo_valor, DATE_FORMAT)
     except ValueError:
         messagebox.showerror(
             "Data Inválida",
@@ -132,6 +360,17 @@ def formatar_data_entrada(event: tk.Event) -> None:
         )
 
 
+def marcar_entrada_data(entrada: ctk.CTkEntry) -> None:
+    """
+    Aplicar a formatação de data ao campo pela bindtag da raiz.
+
+    Args:
+        entrada: Campo de data (DD/MM/YYYY).
+    """
+    interno = entrada._entry
+    interno.bindtags((_BINDTAG_DATA,) + interno.bindtags())
+
+
 def validar_somente_inteiros(valor: str) -> bool:
     """
     Validar se a entrada contém apenas dígitos.
@@ -142,7 +381,67 @@ def validar_somente_inteiros(valor: str) -> bool:
     Returns:
         bool: True se contiver apenas dígitos ou estar vazio, False caso contrário.
     """
-    return valor.isdigit() or valor == ""
+    # isdecimal (e não isdigit) recusa "²", "①" etc., que int() não aceita
+    return valor == "" or valor.isdecimal()
+
+
+def _ler_cache(chave: Tuple) -> Optional[Any]:
+    """Retornar a resposta em cache para a chave, se ainda válida."""
+    with _cache_lock:
+        item = _cache_respostas.get(chave)
+        if item is None:
+            return None
+        expira_em, dados = item
+        if expira_em < time.monotonic():
+            del _cache_respostas[chave]
+            return None
+        return dados
+
+
+def _gravar_cache(chave: Tuple, dados: Any) -> None:
+    """Guardar resposta no cache, descartando a entrada mais antiga se cheio."""
+    with _cache_lock:
+        _cache_respostas.pop(chave, None)
+        if len(_cache_respostas) >= CACHE_MAX_ITENS:
+            del _cache_respostas[next(iter(_cache_respostas))]
+        _cache_respostas[chave] = (time.monotonic() + CACHE_TTL_S, dados)
+
+
+def limpar_cache_respostas() -> None:
+    """Invalidar todas as respostas GET em cache."""
+    with _cache_lock:
+        _cache_respostas.clear()
+
+
+def _obter_sessao() -> Any:
+    """Importar requests e criar a sessão compartilhada na primeira chamada."""
+    global requests, _SESSION
+    with _sessao_lock:
+        if _SESSION is None:
+            import requests as _requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            sessao = _requests.Session()
+            sessao.mount(
+                "http://",
+                HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=20,
+                    max_retries=Retry(
+                        total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)
+                    ),
+                ),
+            )
+            sessao.headers.update({
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+                "User-Agent": "biblioteca-gui/3.0",
+            })
+            atexit.register(sessao.close)
+            requests = _requests
+            _SESSION = sessao
+    return _SESSION
 
 
 def fazer_requisicao_api(
@@ -154,6 +453,9 @@ def fazer_requisicao_api(
     """
     Fazer requisição à API de forma centralizada com tratamento de erros.
 
+    Respostas de GET ficam em cache por CACHE_TTL_S segundos; qualquer escrita
+    bem-sucedida invalida o cache.
+
     Args:
         metodo: Método HTTP (GET, POST, PUT, DELETE, PATCH).
         endpoint: Endpoint da API (ex: '/cliente').
@@ -163,29 +465,44 @@ def fazer_requisicao_api(
     Returns:
         Tuple[bool, Optional[Dict], Optional[str]]: (sucesso, dados, erro)
     """
+    # Fora do try: os handlers abaixo dependem de requests já importado
+    sessao = _obter_sessao()
     try:
-        url = f"{API_BASE_URL}{endpoint}"
-        logger.info(f"Requisição {metodo} para {url}")
+        metodo = metodo.upper()
+        if metodo not in METODOS_HTTP:
+            return False, None, f"Método HTTP '{metodo}' não suportado"
 
+        chave = None
         if metodo == "GET":
-            response = requests.get(url, params=params, timeout=API_TIMEOUT)
-        elif metodo == "POST":
-            response = requests.post(url, json=json_data, timeout=API_TIMEOUT)
-        elif metodo == "PUT":
-            response = requests.put(url, json=json_data, timeout=API_TIMEOUT)
-        elif metodo == "DELETE":
-            response = requests.delete(url, timeout=API_TIMEOUT)
-        elif metodo == "PATCH":
-            response = requests.patch(url, json=json_data, timeout=API_TIMEOUT)
-        else:
-            return False, None, f"Método HTTP '{metodo}' não suportado"
+            chave = (endpoint, tuple(sorted((params or {}).items())))
+            dados = _ler_cache(chave)
+            if dados is not None:
+                return True, dados, None
 
+        url = f"{API_BASE_URL}{endpoint}"
+        logger.info(f"Requisição {metodo} para {url}")
+
+        response = sessao.request(
+            metodo, url, params=params, json=json_data, timeout=API_TIMEOUT
+        )
         response.raise_for_status()
-        dados = response.json()
+        dados = _decodificar_json(response.content)
+
+        if chave is not None:
+            _gravar_cache(chave, dados)
+        else:
+            limpar_cache_respostas()
         return True, dados, None
 
+    except requests.exceptions.ConnectTimeout:
+        erro = (
+            f"Timeout ao conectar ({API_CONNECT_TIMEOUT}s). "
+            f"Verifique se a API está rodando em {API_BASE_URL}"
+        )
+        logger.error(erro)
+        return False, None, erro
     except requests.exceptions.Timeout:
-        erro = f"Timeout na requisição ({API_TIMEOUT}s)"
+        erro = f"Timeout aguardando resposta da API ({API_READ_TIMEOUT}s)"
         logger.error(erro)
         return False, None, erro
     except requests.exceptions.ConnectionError:
@@ -202,28 +519,227 @@ def fazer_requisicao_api(
         return False, None, erro
 
 
-def voltar_tela_inicial(tela_atual: ctk.CTk) -> None:
+def requisitar_em_segundo_plano(
+    janela: ctk.CTk,
+    botao: ctk.CTkButton,
+    ao_concluir,
+    metodo: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    json_data: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Executar fazer_requisicao_api no executor sem travar a interface.
+
+    O botão fica desabilitado enquanto a requisição está pendente. O resultado
+    (sucesso, dados, erro) é entregue a ao_concluir na thread do Tk.
+
+    Args:
+        janela: Tela que agenda a verificação do resultado.
+        botao: Botão que disparou a busca.
+        ao_concluir: Função chamada com (sucesso, dados, erro).
+        metodo: Método HTTP.
+        endpoint: Endpoint da API.
+        params: Parâmetros de query (para GET).
+        json_data: Dados JSON para POST/PUT/PATCH.
+    """
+    botao.configure(state="disabled")
+    futuro = _EXECUTOR.submit(fazer_requisicao_api, metodo, endpoint, params, json_data)
+
+    def verificar() -> None:
+        if not futuro.done():
+            agendar_after(janela, INTERVALO_VERIFICACAO_MS, verificar)
+            return
+        botao.configure(state="normal")
+        ao_concluir(*futuro.result())
+
+    agendar_after(janela, INTERVALO_VERIFICACAO_MS, verificar)
+
+
+def obter_raiz() -> "CustomCTk":
+    """Retornar a janela raiz, criando-a na primeira chamada."""
+    global _raiz
+    if _raiz is None:
+        _raiz = CustomCTk()
+    return _raiz
+
+
+def abrir_tela(
+    titulo: str,
+    geometria: str,
+    fg_color: str = "transparent",
+    adiar_exibicao: bool = False,
+) -> ctk.CTkFrame:
+    """
+    Substituir a tela exibida na janela raiz por um frame novo.
+
+    A raiz (e o interpretador Tcl) é reaproveitada entre as telas; apenas o
+    frame de conteúdo é destruído, junto com os timers pendentes dele.
+
+    Args:
+        titulo: Título da janela.
+        geometria: Tamanho da janela (ex: '250x420').
+        fg_color: Cor de fundo da tela.
+        adiar_exibicao: Se True, a troca só acontece em exibir_tela_pendente(),
+            depois de todos os widgets criados (um único cálculo de layout).
+
+    Returns:
+        ctk.CTkFrame: Frame onde a nova tela deve ser montada.
+    """
+    global _tela_pendente
+    tela = ctk.CTkFrame(obter_raiz(), fg_color=fg_color, corner_radius=0)
+    _tela_pendente = (tela, titulo, geometria)
+    if not adiar_exibicao:
+        exibir_tela_pendente()
+    return tela
+
+
+def exibir_tela_pendente() -> None:
+    """Trocar a tela exibida pela última criada com abrir_tela."""
+    global _tela_atual, _tela_pendente
+    if _tela_pendente is None:
+        return
+    tela, titulo, geometria = _tela_pendente
+    _tela_pendente = None
+
+    raiz = obter_raiz()
+    if _tela_atual is not None:
+        cancelar_timers(_tela_atual)
+        _tela_atual.destroy()
+
+    raiz.title(titulo)
+    raiz.geometry(geometria)
+    tela.pack(fill="both", expand=True)
+    _tela_atual = tela
+
+
+def fechar_aplicacao() -> None:
+    """Encerrar a aplicação destruindo a janela raiz."""
+    if _raiz is not None:
+        _raiz.destroy()
+
+
+def voltar_tela_inicial(tela_atual: ctk.CTkFrame) -> None:
     """
     Fechar tela atual e retornar à tela inicial.
 
     Args:
-        tela_atual: Janela atual a ser fechada.
+        tela_atual: Tela atual (substituída pela inicial).
     """
-    tela_atual.destroy()
     tela_inicial()
 
 
+def criar_botoes_menu(tela: ctk.CTkFrame, botoes: Tuple) -> None:
+    """
+    Criar os botões de um menu a partir de uma tabela _BOTOES_*.
+
+    Args:
+        tela: Frame do menu.
+        botoes: Tabela com (opções, y, nome da tela de destino ou None).
+    """
+    for opcoes, y_pos, destino in botoes:
+        comando = None
+        if destino is not None:
+            comando = lambda nome=destino: globals()[nome](tela)  # noqa: E731
+        ctk.CTkButton(tela, command=comando, **opcoes).place(y=y_pos, x=60)
+
+
+def criar_botao(
+    tela: Any,
+    texto: str,
+    comando: Any,
+    estilo: str = "padrao",
+    **extras: Any,
+) -> ctk.CTkButton:
+    """
+    Criar um botão com as opções de um estilo de _ESTILOS_BOTAO.
+
+    Args:
+        tela: Widget pai do botão.
+        texto: Texto do botão.
+        comando: Função chamada no clique.
+        estilo: Nome do estilo em _ESTILOS_BOTAO.
+        **extras: Opções que sobrescrevem as do estilo.
+
+    Returns:
+        ctk.CTkButton: Botão criado (ainda não posicionado).
+    """
+    opcoes = _ESTILOS_BOTAO[estilo]
+    if extras:
+        opcoes = {**opcoes, **extras}
+    return ctk.CTkButton(tela, text=texto, command=comando, **opcoes)
+
+
+def construir_formulario(
+    tela: ctk.CTkFrame,
+    campos: Tuple,
+    y_inicial: int,
+    x_rotulo: int,
+    x_entrada: int = 230,
+    passo: int = 30,
+    opcoes_rotulo: Optional[Dict[str, Any]] = None,
+    opcoes_entrada: Optional[Dict[str, Any]] = None,
+    validacao_inteiros: Optional[str] = None,
+) -> Dict[str, ctk.CTkEntry]:
+    """
+    Criar os pares rótulo + campo de um formulário, um por linha.
+
+    Args:
+        tela: Frame do formulário.
+        campos: Tabela _CAMPOS_* com (rótulo, nome do entry[, só inteiros]).
+        y_inicial: Posição y da primeira linha.
+        x_rotulo: Posição x dos rótulos.
+        x_entrada: Posição x dos campos.
+        passo: Distância vertical entre as linhas.
+        opcoes_rotulo: Opções extras dos CTkLabel.
+        opcoes_entrada: Opções dos CTkEntry (padrão: 400x15).
+        validacao_inteiros: Comando Tcl registrado para campos só inteiros.
+
+    Returns:
+        Dict[str, ctk.CTkEntry]: Campos criados, indexados pelo nome do entry.
+    """
+    CTkLabel = ctk.CTkLabel
+    CTkEntry = ctk.CTkEntry
+    opcoes_rotulo = opcoes_rotulo or {}
+    opcoes_entrada = opcoes_entrada or {"width": 400, "height": 15}
+
+    entradas: Dict[str, ctk.CTkEntry] = {}
+    y_pos = y_inicial
+    for rotulo, nome, *so_inteiros in campos:
+        CTkLabel(tela, text=rotulo, **opcoes_rotulo).place(y=y_pos, x=x_rotulo)
+        opcoes = opcoes_entrada
+        if so_inteiros and so_inteiros[0] and validacao_inteiros is not None:
+            opcoes = {
+                **opcoes_entrada,
+                "validate": "key",
+                "validatecommand": (validacao_inteiros, "%P"),
+            }
+        entrada = CTkEntry(tela, **opcoes)
+        entrada.place(y=y_pos, x=x_entrada)
+        entradas[nome] = entrada
+        y_pos += passo
+    return entradas
+
+
 def configurar_estilo_treeview(frame: tk.Frame) -> ttk.Style:
     """
     Configurar estilo da tabela (Treeview) com tema escuro.
 
+    A configuração é feita uma única vez; chamadas seguintes reaproveitam o
+    estilo já aplicado.
+
     Args:
         frame: Frame pai onde a tabela será colocada.
 
     Returns:
         ttk.Style: Objeto de estilo configurado.
     """
-    style = ttk.Style()
+    global _estilo_treeview
+    # A raiz é única (obter_raiz), então o estilo configurado vale para todas as telas
+    if _estilo_treeview is not None:
+        return _estilo_treeview
+
+    style = ttk.Style(frame)
     style.theme_use("clam")
 
     style.configure(
@@ -250,6 +766,7 @@ def configurar_estilo_treeview(frame: tk.Frame) -> ttk.Style:
         foreground=[("selected", "white")],
     )
 
+    _estilo_treeview = style
     return style
 
 
@@ -283,7 +800,6 @@ def criar_tabela_resultados(
         yscrollcommand=tree_scroll_y.set,
         xscrollcommand=tree_scroll_x.set,
     )
-    tree.grid(row=0, column=0, sticky="nsew")
 
     tree_scroll_y.config(command=tree.yview)
     tree_scroll_x.config(command=tree.xview)
@@ -296,29 +812,95 @@ def criar_tabela_resultados(
         tree.heading(col, text=col)
         tree.column(col, anchor="center", width=150, stretch=True)
 
-    # Configurar tags para linhas alternadas
-    tree.tag_configure("oddrow", background="#1a1a1a")
-    tree.tag_configure("evenrow", background="#2a2a2a")
-
-    # Inserir dados
-    for i, item in enumerate(dados):
-        valores = extrator_dados_func(item)
-        tree.insert(
-            "",
-            "end",
-            values=valores,
-            tags=("oddrow" if i % 2 == 0 else "evenrow"),
+    # Configurar tags para linhas alternadas (tags pertencem a cada Treeview)
+    for tag, cor in _CORES_TAGS.items():
+        tree.tag_configure(tag, background=cor)
+
+    # Inserir dados: extrai todas as linhas antes e chama o comando Tcl do
+    # Treeview diretamente, sem o tratamento de opções de tree.insert por linha
+    linhas = [extrator_dados_func(item) for item in dados]
+    chamar_tcl = tree.tk.call
+    caminho = str(tree)
+    for i, valores in enumerate(linhas):
+        chamar_tcl(
+            caminho, "insert", "", "end",
+            "-values", valores,
+            "-tags", _TAGS[i & 1],
         )
 
-    frame.tk.call("tk", "scaling", 1.0)
+    # Só entra no gerenciador de geometria depois de populada: um único cálculo
+    tree.grid(row=0, column=0, sticky="nsew")
+
+
+# Colunas e extratores das tabelas de resultado
+_COLUNAS_CLIENTE: Tuple[str, ...] = (
+    "Nome",
+    "Sobrenome",
+    "CPF",
+    "DataNascimento",
+    "DataAfiliacao",
+    "QntdLivrosReservados",
+    "QntdPendencias",
+    "CEP",
+    "Numero",
+    "Bairro",
+    "Cidade",
+    "Estado",
+    "Complemento",
+)
+
+_COLUNAS_LIVRO: Tuple[str, ...] = (
+    "Autor",
+    "NomeLivro",
+    "Genero",
+    "Idioma",
+    "QntdPagina",
+    "Editora",
+    "DataPublicacao",
+    "QntdDisponivel",
+)
+
+
+def _extrair_cliente(cliente: Dict[str, Any]) -> Tuple:
+    """Extrair dados do cliente para exibição."""
+    endereco = cliente.get("endereco") or {}
+    return (
+        cliente.get("Nome", "N/A"),
+        cliente.get("Sobrenome", "N/A"),
+        cliente.get("CPF", "N/A"),
+        cliente.get("DataNascimento", "N/A"),
+        cliente.get("DataAfiliacao", "N/A"),
+        cliente.get("QuantidadeLivrosReservados", 0),
+        cliente.get("QuantidadePendencias", 0),
+        endereco.get("CEP", "N/A"),
+        endereco.get("Numero", "N/A"),
+        endereco.get("Bairro", "N/A"),
+        endereco.get("Cidade", "N/A"),
+        endereco.get("Estado", "N/A"),
+        endereco.get("Complemento", "N/A"),
+    )
+
+
+def _extrair_livro(livro: Dict[str, Any]) -> Tuple:
+    """Extrair dados do livro para exibição."""
+    return (
+        livro.get("Autor", "N/A"),
+        livro.get("NomeLivro", "N/A"),
+        (livro.get("genero") or {}).get("NomeGenero", "N/A"),
+        livro.get("Idioma", "N/A"),
+        livro.get("QuantidadePaginas", "N/A"),
+        livro.get("Editora", "N/A"),
+        livro.get("DataPublicacao", "N/A"),
+        livro.get("QuantidadeDisponivel", "N/A"),
+    )
 
 
 # ==================== Telas Principais ====================
 def tela_inicial() -> None:
     """Tela inicial do sistema com menu principal."""
-    janela = CustomCTk(fg_color=COLOR_BACKGROUND)
-    janela.title("Biblioteca - Menu Principal")
-    janela.geometry("250x420")
+    janela = abrir_tela(
+        "Biblioteca - Menu Principal", "250x420", fg_color=COLOR_BACKGROUND
+    )
 
     # Título
     titulo = ctk.CTkLabel(janela, text="Seja Bem Vindo!", text_color=COLOR_TEXT)
@@ -329,167 +911,207 @@ def tela_inicial() -> None:
     subtitulo.place(y=115, x=70)
 
     # Botões
-    botoes = [
-        ("Consulta", lambda: pri_consulta(janela), "#9CAD84"),
-        ("Cadastro", lambda: pri_cadastro(janela), "#B36A5E"),
-        ("Reservas", lambda: pri_reserva(janela), "#5F8D96"),
-        ("Exclusão", lambda: pri_exclusao(janela), "#7C5E67"),
-    ]
-
-    y_pos = 150
-    for texto, comando, cor_hover in botoes:
-        btn = ctk.CTkButton(
-            janela,
-            text=texto,
-            fg_color=COLOR_PRIMARY,
-            text_color=COLOR_TEXT,
-            hover_color=cor_hover,
-            command=comando,
-        )
-        btn.place(y=y_pos, x=60)
-        y_pos += 35
+    criar_botoes_menu(janela, _BOTOES_INICIAL)
 
     # Botão Sair
-    btn_sair = ctk.CTkButton(
+    btn_sair = criar_botao(
         janela,
-        text="Sair",
-        fg_color=COLOR_PRIMARY,
+        "Sair",
+        fechar_aplicacao,
+        estilo="sair",
         text_color=COLOR_TEXT,
-        hover_color=COLOR_ERROR,
-        command=janela.destroy,
     )
     btn_sair.place(y=385, x=105)
 
-    janela.mainloop()
-
 
 # ==================== Consultas ====================
-def pri_consulta(tela_anterior: ctk.CTk) -> None:
+def pri_consulta(tela_anterior: ctk.CTkFrame) -> None:
     """Menu primário de consultas."""
-    tela_anterior.destroy()
-
-    tela_consulta = CustomCTk(fg_color="#6D7B74")
-    tela_consulta.title("Consultas")
-    tela_consulta.geometry("250x420")
+    tela_consulta = abrir_tela("Consultas", "250x420", fg_color="#6D7B74")
 
     opcao = ctk.CTkLabel(tela_consulta, text="Escolha uma opção:", text_color="black")
     opcao.place(y=110, x=70)
 
-    opcoes_consulta = [
-        ("Nome Usuário", lambda: sec_consulta_nomeusuario(tela_consulta), "#5F8D96"),
-        ("Por Estado", lambda: sec_consulta_estado(tela_consulta), "#9CAD84"),
-        ("Nome Livro", lambda: sec_consulta_nomelivro(tela_consulta), "#B36A5E"),
-        ("Nome Autor", lambda: sec_consulta_nomeautor(tela_consulta), "#7C5E67"),
-        ("Por Gênero", lambda: sec_consulta_genero(tela_consulta), "#ADA584"),
-    ]
-
-    y_pos = 140
-    for texto, comando, cor_hover in opcoes_consulta:
-        btn = ctk.CTkButton(
-            tela_consulta,
-            text=texto,
-            fg_color=COLOR_PRIMARY,
-            hover_color=cor_hover,
-            command=comando,
-        )
-        btn.place(y=y_pos, x=60)
-        y_pos += 30
+    criar_botoes_menu(tela_consulta, _BOTOES_CONSULTA)
 
     # Botão Voltar
-    btn_voltar = ctk.CTkButton(
+    btn_voltar = criar_botao(
         tela_consulta,
-        text="Voltar ao Menu Anterior",
-        text_color="black",
-        fg_color="#6D7B74",
-        hover_color="#55635C",
-        command=lambda: voltar_tela_inicial(tela_consulta),
-        font=("Arial", 14, "underline"),
+        "Voltar ao Menu Anterior",
+        lambda: voltar_tela_inicial(tela_consulta),
+        estilo="voltar",
     )
     btn_voltar.place(y=5, x=5)
 
     # Botão Sair
-    btn_sair = ctk.CTkButton(
+    btn_sair = criar_botao(
         tela_consulta,
-        text="Sair",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=tela_consulta.destroy,
+        "Sair",
+        fechar_aplicacao,
+        estilo="sair",
     )
     btn_sair.place(y=380, x=105)
 
-    tela_consulta.mainloop()
-
 
-def sec_consulta_nomeusuario(tela_anterior: ctk.CTk) -> None:
-    """Tela de busca de usuário por nome."""
-    tela_anterior.destroy()
+def _construir_tela_consulta(
+    tela_anterior: ctk.CTkFrame,
+    titulo: str,
+    rotulo: str,
+    aviso: str,
+    endpoint: str,
+    chave_param: str,
+    exibir_encontrados,
+    mensagem_vazio: str,
+) -> None:
+    """
+    Montar uma tela de consulta simples (um campo + botão Procurar).
 
-    tela_busca = CustomCTk(fg_color="#6D7B74")
-    tela_busca.title("Consulta - Nome de Usuário")
-    tela_busca.geometry("330x250")
+    Args:
+        tela_anterior: Tela atual (substituída pela consulta).
+        titulo: Título da janela.
+        rotulo: Texto acima do campo de busca.
+        aviso: Mensagem exibida quando o campo está vazio.
+        endpoint: Endpoint GET da API.
+        chave_param: Nome do parâmetro de query enviado com o termo.
+        exibir_encontrados: Função chamada com (itens, tela_busca, termo).
+        mensagem_vazio: Mensagem sem resultados; aceita o campo {termo}.
+    """
+    tela_busca = abrir_tela(titulo, "330x250", fg_color="#6D7B74")
 
-    def buscar_usuario() -> None:
-        """Buscar usuário por nome na API."""
-        nome = entry_nome.get().strip()
-        if not nome:
-            messagebox.showwarning("Atenção", "Digite um nome válido.")
+    def buscar() -> None:
+        """Consultar a API com o termo digitado."""
+        termo = entry_busca.get().strip()
+        if not termo:
+            messagebox.showwarning("Atenção", aviso)
             return
 
-        sucesso, dados, erro = fazer_requisicao_api(
-            "GET", "/cliente", params={"Nome": nome}
+        requisitar_em_segundo_plano(
+            tela_busca, btn_procurar,
+            lambda *resultado: exibir_resultado(termo, *resultado),
+            "GET", endpoint, params={chave_param: termo},
         )
 
+    def exibir_resultado(
+        termo: str,
+        sucesso: bool,
+        dados: Optional[Dict[str, Any]],
+        erro: Optional[str],
+    ) -> None:
+        """Exibir o resultado da busca na thread da interface."""
         if not sucesso:
             messagebox.showerror("Erro", erro)
             return
 
-        clientes = dados.get("data", [])
-        if clientes:
-            ter_resultado_nome(clientes, tela_busca)
+        itens = dados.get("data", [])
+        if itens:
+            exibir_encontrados(itens, tela_busca, termo)
         else:
-            messagebox.showinfo("Resultado", "Nenhum cliente encontrado.")
+            messagebox.showinfo("Resultado", mensagem_vazio.format(termo=termo))
 
-    label_nome = ctk.CTkLabel(
-        tela_busca, text="Digite o Nome do Usuário que deseja Buscar"
-    )
-    label_nome.place(y=65, x=40)
+    label_busca = ctk.CTkLabel(tela_busca, text=rotulo)
+    label_busca.place(y=65, x=40)
 
-    entry_nome = ctk.CTkEntry(
+    entry_busca = ctk.CTkEntry(
         tela_busca, width=250, height=30, justify="center"
     )
-    entry_nome.place(y=95, x=40)
+    entry_busca.place(y=95, x=40)
 
-    btn_procurar = ctk.CTkButton(
-        tela_busca, text="Procurar", command=buscar_usuario
-    )
+    btn_procurar = criar_botao(tela_busca, "Procurar", buscar)
     btn_procurar.place(y=145, x=95)
 
-    btn_voltar = ctk.CTkButton(
+    btn_voltar = criar_botao(
         tela_busca,
-        text="Voltar ao Menu Anterior",
-        text_color="black",
-        fg_color="#6D7B74",
-        hover_color="#55635C",
-        font=("Arial", 14, "underline"),
-        command=lambda: voltar_tela_inicial(tela_busca),
+        "Voltar ao Menu Anterior",
+        lambda: voltar_tela_inicial(tela_busca),
+        estilo="voltar",
     )
     btn_voltar.place(y=5, x=5)
 
-    btn_sair = ctk.CTkButton(
-        tela_busca,
-        text="Sair",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=tela_busca.destroy,
-    )
+    btn_sair = criar_botao(tela_busca, "Sair", fechar_aplicacao, estilo="sair")
     btn_sair.place(y=220, x=95)
 
-    tela_busca.mainloop()
+
+# Configuração de cada consulta:
+# (título, rótulo, aviso, endpoint, parâmetro, exibição, mensagem sem resultado)
+_CONSULTAS: Dict[str, Tuple] = {
+    "nomeusuario": (
+        "Consulta - Nome de Usuário",
+        "Digite o Nome do Usuário que deseja Buscar",
+        "Digite um nome válido.",
+        "/cliente",
+        "Nome",
+        lambda itens, tela, _termo: ter_resultado_nome(itens, tela),
+        "Nenhum cliente encontrado.",
+    ),
+    "estado": (
+        "Consulta - Por Estado",
+        "Digite o Nome do Estado que deseja Buscar",
+        "Digite um estado válido.",
+        "/endereco",
+        "Estado",
+        lambda itens, tela, _termo: ter_resultado_estado(itens, tela),
+        "Nenhum cliente encontrado.",
+    ),
+    "nomelivro": (
+        "Consulta - Nome de Livro",
+        "Digite o Nome do Livro que deseja Buscar",
+        "Digite um livro válido.",
+        "/livro",
+        "NomeLivro",
+        lambda itens, tela, _termo: ter_resultado_livro(itens, tela),
+        "Nenhum livro encontrado.",
+    ),
+    "nomeautor": (
+        "Consulta - Nome do Autor",
+        "Digite o Nome do Autor que deseja Buscar",
+        "Digite um autor válido.",
+        "/livro/autor",
+        "NomeAutor",
+        lambda itens, tela, _termo: ter_resultado_livro(itens, tela),
+        "Nenhum livro encontrado.",
+    ),
+    "genero": (
+        "Consulta - Por Gênero",
+        "Digite o Nome do Gênero que deseja Buscar",
+        "Digite um gênero válido.",
+        "/genero",
+        "NomeGenero",
+        lambda itens, tela, termo: ter_resultado_genero(itens, tela, termo),
+        "Nenhum livro encontrado para o gênero '{termo}'.",
+    ),
+}
+
+
+def sec_consulta_nomeusuario(tela_anterior: ctk.CTkFrame) -> None:
+    """Tela de busca de usuário por nome."""
+    _construir_tela_consulta(tela_anterior, *_CONSULTAS["nomeusuario"])
+
+
+def sec_consulta_estado(tela_anterior: ctk.CTkFrame) -> None:
+    """Tela de busca de usuários por estado."""
+    _construir_tela_consulta(tela_anterior, *_CONSULTAS["estado"])
+
+
+def sec_consulta_nomelivro(tela_anterior: ctk.CTkFrame) -> None:
+    """Tela de busca de livro por nome."""
+    _construir_tela_consulta(tela_anterior, *_CONSULTAS["nomelivro"])
+
+
+def sec_consulta_nomeautor(tela_anterior: ctk.CTkFrame) -> None:
+    """Tela de busca de livro por autor."""
+    _construir_tela_consulta(tela_anterior, *_CONSULTAS["nomeautor"])
+
+
+def sec_consulta_genero(tela_anterior: ctk.CTkFrame) -> None:
+    """Tela de busca de livros por gênero."""
+    _construir_tela_consulta(tela_anterior, *_CONSULTAS["genero"])
 
 
-def ter_resultado_nome(dados: List[Dict[str, Any]], tela_anterior: ctk.CTk) -> None:
+def ter_resultado_nome(
+    dados: List[Dict[str, Any]], tela_anterior: ctk.CTkFrame
+) -> None:
     """Exibir resultados de busca de usuários por nome."""
-    tela_resultado = ctk.CTkToplevel(fg_color="#000000")
+    tela_resultado = ctk.CTkToplevel(obter_raiz(), fg_color="#000000")
     tela_resultado.title("Resultado da Busca")
     tela_resultado.geometry("1200x600")
     tela_resultado.configure(bg="black")
@@ -498,16 +1120,12 @@ def ter_resultado_nome(dados: List[Dict[str, Any]], tela_anterior: ctk.CTk) -> N
     def voltar() -> None:
         """Voltar à tela anterior."""
         tela_resultado.destroy()
-        tela_anterior()
 
-    btn_voltar = ctk.CTkButton(
+    btn_voltar = criar_botao(
         tela_resultado,
-        text="Voltar ao Menu Anterior",
-        text_color="white",
-        fg_color="#000000",
-        hover_color="#575757",
-        font=("Arial", 14, "underline"),
-        command=voltar,
+        "Voltar ao Menu Anterior",
+        voltar,
+        estilo="voltar_resultado",
     )
     btn_voltar.place(y=10, x=10)
 
@@ -519,115 +1137,14 @@ def ter_resultado_nome(dados: List[Dict[str, Any]], tela_anterior: ctk.CTk) -> N
     # Configurar estilo
     configurar_estilo_treeview(frame)
 
-    # Colunas
-    colunas = (
-        "Nome",
-        "Sobrenome",
-        "CPF",
-        "DataNascimento",
-        "DataAfiliacao",
-        "QntdLivrosReservados",
-        "QntdPendencias",
-        "CEP",
-        "Numero",
-        "Bairro",
-        "Cidade",
-        "Estado",
-        "Complemento",
-    )
-
-    def extrair_dados_cliente(cliente: Dict[str, Any]) -> Tuple:
-        """Extrair dados do cliente para exibição."""
-        endereco = cliente.get("endereco", {})
-        return (
-            cliente.get("Nome", "N/A"),
-            cliente.get("Sobrenome", "N/A"),
-            cliente.get("CPF", "N/A"),
-            cliente.get("DataNascimento", "N/A"),
-            cliente.get("DataAfiliacao", "N/A"),
-            cliente.get("QuantidadeLivrosReservados", 0),
-            cliente.get("QuantidadePendencias", 0),
-            endereco.get("CEP", "N/A"),
-            endereco.get("Numero", "N/A"),
-            endereco.get("Bairro", "N/A"),
-            endereco.get("Cidade", "N/A"),
-            endereco.get("Estado", "N/A"),
-            endereco.get("Complemento", "N/A"),
-        )
+    criar_tabela_resultados(frame, _COLUNAS_CLIENTE, dados, _extrair_cliente)
 
-    criar_tabela_resultados(frame, colunas, dados, extrair_dados_cliente)
 
-
-def sec_consulta_estado(tela_anterior: ctk.CTk) -> None:
-    """Tela de busca de usuários por estado."""
-    tela_anterior.destroy()
-
-    tela_busca = CustomCTk(fg_color="#6D7B74")
-    tela_busca.title("Consulta - Por Estado")
-    tela_busca.geometry("330x250")
-
-    def buscar_por_estado() -> None:
-        """Buscar usuários por estado na API."""
-        estado = entry_estado.get().strip()
-        if not estado:
-            messagebox.showwarning("Atenção", "Digite um estado válido.")
-            return
-
-        sucesso, dados, erro = fazer_requisicao_api(
-            "GET", "/endereco", params={"Estado": estado}
-        )
-
-        if not sucesso:
-            messagebox.showerror("Erro", erro)
-            return
-
-        clientes = dados.get("data", [])
-        if clientes:
-            ter_resultado_estado(clientes, tela_busca)
-        else:
-            messagebox.showinfo("Resultado", "Nenhum cliente encontrado.")
-
-    label_estado = ctk.CTkLabel(
-        tela_busca, text="Digite o Nome do Estado que deseja Buscar"
-    )
-    label_estado.place(y=65, x=40)
-
-    entry_estado = ctk.CTkEntry(
-        tela_busca, width=250, height=30, justify="center"
-    )
-    entry_estado.place(y=95, x=40)
-
-    btn_procurar = ctk.CTkButton(
-        tela_busca, text="Procurar", command=buscar_por_estado
-    )
-    btn_procurar.place(y=145, x=95)
-
-    btn_voltar = ctk.CTkButton(
-        tela_busca,
-        text="Voltar ao Menu Anterior",
-        text_color="black",
-        fg_color="#6D7B74",
-        hover_color="#55635C",
-        font=("Arial", 14, "underline"),
-        command=lambda: voltar_tela_inicial(tela_busca),
-    )
-    btn_voltar.place(y=5, x=5)
-
-    btn_sair = ctk.CTkButton(
-        tela_busca,
-        text="Sair",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=tela_busca.destroy,
-    )
-    btn_sair.place(y=220, x=95)
-
-    tela_busca.mainloop()
-
-
-def ter_resultado_estado(dados: List[Dict[str, Any]], tela_anterior: ctk.CTk) -> None:
+def ter_resultado_estado(
+    dados: List[Dict[str, Any]], tela_anterior: ctk.CTkFrame
+) -> None:
     """Exibir resultados de busca de usuários por estado."""
-    tela_resultado = ctk.CTkToplevel(fg_color="#000000")
+    tela_resultado = ctk.CTkToplevel(obter_raiz(), fg_color="#000000")
     tela_resultado.title("Resultado da Busca - Por Estado")
     tela_resultado.geometry("1200x600")
     tela_resultado.configure(bg="black")
@@ -635,16 +1152,12 @@ def ter_resultado_estado(dados: List[Dict[str, Any]], tela_anterior: ctk.CTk) ->
 
     def voltar() -> None:
         tela_resultado.destroy()
-        tela_anterior()
 
-    btn_voltar = ctk.CTkButton(
+    btn_voltar = criar_botao(
         tela_resultado,
-        text="Voltar ao Menu Anterior",
-        text_color="white",
-        fg_color="#000000",
-        hover_color="#575757",
-        font=("Arial", 14, "underline"),
-        command=voltar,
+        "Voltar ao Menu Anterior",
+        voltar,
+        estilo="voltar_resultado",
     )
     btn_voltar.place(y=10, x=10)
 
@@ -654,113 +1167,14 @@ def ter_resultado_estado(dados: List[Dict[str, Any]], tela_anterior: ctk.CTk) ->
 
     configurar_estilo_treeview(frame)
 
-    colunas = (
-        "Nome",
-        "Sobrenome",
-        "CPF",
-        "DataNascimento",
-        "DataAfiliacao",
-        "QntdLivrosReservados",
-        "QntdPendencias",
-        "CEP",
-        "Numero",
-        "Bairro",
-        "Cidade",
-        "Estado",
-        "Complemento",
-    )
-
-    def extrair_dados_cliente(cliente: Dict[str, Any]) -> Tuple:
-        endereco = cliente.get("endereco", {})
-        return (
-            cliente.get("Nome", "N/A"),
-            cliente.get("Sobrenome", "N/A"),
-            cliente.get("CPF", "N/A"),
-            cliente.get("DataNascimento", "N/A"),
-            cliente.get("DataAfiliacao", "N/A"),
-            cliente.get("QuantidadeLivrosReservados", 0),
-            cliente.get("QuantidadePendencias", 0),
-            endereco.get("CEP", "N/A"),
-            endereco.get("Numero", "N/A"),
-            endereco.get("Bairro", "N/A"),
-            endereco.get("Cidade", "N/A"),
-            endereco.get("Estado", "N/A"),
-            endereco.get("Complemento", "N/A"),
-        )
-
-    criar_tabela_resultados(frame, colunas, dados, extrair_dados_cliente)
-
-
-def sec_consulta_nomelivro(tela_anterior: ctk.CTk) -> None:
-    """Tela de busca de livro por nome."""
-    tela_anterior.destroy()
-
-    tela_busca = CustomCTk(fg_color="#6D7B74")
-    tela_busca.title("Consulta - Nome de Livro")
-    tela_busca.geometry("330x250")
+    criar_tabela_resultados(frame, _COLUNAS_CLIENTE, dados, _extrair_cliente)
 
-    def buscar_livro() -> None:
-        """Buscar livro por nome na API."""
-        livro = entry_livro.get().strip()
-        if not livro:
-            messagebox.showwarning("Atenção", "Digite um livro válido.")
-            return
 
-        sucesso, dados, erro = fazer_requisicao_api(
-            "GET", "/livro", params={"NomeLivro": livro}
-        )
-
-        if not sucesso:
-            messagebox.showerror("Erro", erro)
-            return
-
-        livros = dados.get("data", [])
-        if livros:
-            ter_resultado_livro(livros, tela_busca)
-        else:
-            messagebox.showinfo("Resultado", "Nenhum livro encontrado.")
-
-    label_livro = ctk.CTkLabel(
-        tela_busca, text="Digite o Nome do Livro que deseja Buscar"
-    )
-    label_livro.place(y=65, x=40)
-
-    entry_livro = ctk.CTkEntry(
-        tela_busca, width=250, height=30, justify="center"
-    )
-    entry_livro.place(y=95, x=40)
-
-    btn_procurar = ctk.CTkButton(
-        tela_busca, text="Procurar", command=buscar_livro
-    )
-    btn_procurar.place(y=145, x=95)
-
-    btn_voltar = ctk.CTkButton(
-        tela_busca,
-        text="Voltar ao Menu Anterior",
-        text_color="black",
-        fg_color="#6D7B74",
-        hover_color="#55635C",
-        font=("Arial", 14, "underline"),
-        command=lambda: voltar_tela_inicial(tela_busca),
-    )
-    btn_voltar.place(y=5, x=5)
-
-    btn_sair = ctk.CTkButton(
-        tela_busca,
-        text="Sair",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=tela_busca.destroy,
-    )
-    btn_sair.place(y=220, x=95)
-
-    tela_busca.mainloop()
-
-
-def ter_resultado_livro(dados: List[Dict[str, Any]], tela_anterior: ctk.CTk) -> None:
+def ter_resultado_livro(
+    dados: List[Dict[str, Any]], tela_anterior: ctk.CTkFrame
+) -> None:
     """Exibir resultados de busca de livros."""
-    tela_resultado = ctk.CTkToplevel(fg_color="#000000")
+    tela_resultado = ctk.CTkToplevel(obter_raiz(), fg_color="#000000")
     tela_resultado.title("Resultado da Busca - Livros")
     tela_resultado.geometry("1200x600")
     tela_resultado.configure(bg="black")
@@ -768,16 +1182,12 @@ def ter_resultado_livro(dados: List[Dict[str, Any]], tela_anterior: ctk.CTk) ->
 
     def voltar() -> None:
         tela_resultado.destroy()
-        tela_anterior()
 
-    btn_voltar = ctk.CTkButton(
+    btn_voltar = criar_botao(
         tela_resultado,
-        text="Voltar ao Menu Anterior",
-        text_color="white",
-        fg_color="#000000",
-        hover_color="#575757",
-        font=("Arial", 14, "underline"),
-        command=voltar,
+        "Voltar ao Menu Anterior",
+        voltar,
+        estilo="voltar_resultado",
     )
     btn_voltar.place(y=10, x=10)
 
@@ -787,173 +1197,16 @@ def ter_resultado_livro(dados: List[Dict[str, Any]], tela_anterior: ctk.CTk) ->
 
     configurar_estilo_treeview(frame)
 
-    colunas = (
-        "Autor",
-        "NomeLivro",
-        "Genero",
-        "Idioma",
-        "QntdPagina",
-        "Editora",
-        "DataPublicacao",
-        "QntdDisponivel",
-    )
-
-    def extrair_dados_livro(livro: Dict[str, Any]) -> Tuple:
-        return (
-            livro.get("Autor", "N/A"),
-            livro.get("NomeLivro", "N/A"),
-            livro.get("genero", {}).get("NomeGenero", "N/A"),
-            livro.get("Idioma", "N/A"),
-            livro.get("QuantidadePaginas", "N/A"),
-            livro.get("Editora", "N/A"),
-            livro.get("DataPublicacao", "N/A"),
-            livro.get("QuantidadeDisponivel", "N/A"),
-        )
-
-    criar_tabela_resultados(frame, colunas, dados, extrair_dados_livro)
-
-
-def sec_consulta_nomeautor(tela_anterior: ctk.CTk) -> None:
-    """Tela de busca de livro por autor."""
-    tela_anterior.destroy()
-
-    tela_busca = CustomCTk(fg_color="#6D7B74")
-    tela_busca.title("Consulta - Nome do Autor")
-    tela_busca.geometry("330x250")
-
-    def buscar_por_autor() -> None:
-        """Buscar livros por autor na API."""
-        autor = entry_autor.get().strip()
-        if not autor:
-            messagebox.showwarning("Atenção", "Digite um autor válido.")
-            return
-
-        sucesso, dados, erro = fazer_requisicao_api(
-            "GET", "/livro/autor", params={"NomeAutor": autor}
-        )
-
-        if not sucesso:
-            messagebox.showerror("Erro", erro)
-            return
-
-        livros = dados.get("data", [])
-        if livros:
-            ter_resultado_livro(livros, tela_busca)
-        else:
-            messagebox.showinfo("Resultado", "Nenhum livro encontrado.")
-
-    label_autor = ctk.CTkLabel(
-        tela_busca, text="Digite o Nome do Autor que deseja Buscar"
-    )
-    label_autor.place(y=65, x=40)
-
-    entry_autor = ctk.CTkEntry(
-        tela_busca, width=250, height=30, justify="center"
-    )
-    entry_autor.place(y=95, x=40)
-
-    btn_procurar = ctk.CTkButton(
-        tela_busca, text="Procurar", command=buscar_por_autor
-    )
-    btn_procurar.place(y=145, x=95)
-
-    btn_voltar = ctk.CTkButton(
-        tela_busca,
-        text="Voltar ao Menu Anterior",
-        text_color="black",
-        fg_color="#6D7B74",
-        hover_color="#55635C",
-        font=("Arial", 14, "underline"),
-        command=lambda: voltar_tela_inicial(tela_busca),
-    )
-    btn_voltar.place(y=5, x=5)
-
-    btn_sair = ctk.CTkButton(
-        tela_busca,
-        text="Sair",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=tela_busca.destroy,
-    )
-    btn_sair.place(y=220, x=95)
-
-    tela_busca.mainloop()
-
-
-def sec_consulta_genero(tela_anterior: ctk.CTk) -> None:
-    """Tela de busca de livros por gênero."""
-    tela_anterior.destroy()
-
-    tela_busca = CustomCTk(fg_color="#6D7B74")
-    tela_busca.title("Consulta - Por Gênero")
-    tela_busca.geometry("330x250")
-
-    def buscar_por_genero() -> None:
-        """Buscar livros por gênero na API."""
-        genero = entry_genero.get().strip()
-        if not genero:
-            messagebox.showwarning("Atenção", "Digite um gênero válido.")
-            return
-
-        sucesso, dados, erro = fazer_requisicao_api(
-            "GET", "/genero", params={"NomeGenero": genero}
-        )
-
-        if not sucesso:
-            messagebox.showerror("Erro", erro)
-            return
-
-        livros = dados.get("data", [])
-        if livros:
-            ter_resultado_genero(livros, tela_busca, genero)
-        else:
-            messagebox.showinfo(
-                "Resultado", f"Nenhum livro encontrado para o gênero '{genero}'."
-            )
-
-    label_genero = ctk.CTkLabel(
-        tela_busca, text="Digite o Nome do Gênero que deseja Buscar"
-    )
-    label_genero.place(y=65, x=40)
-
-    entry_genero = ctk.CTkEntry(
-        tela_busca, width=250, height=30, justify="center"
-    )
-    entry_genero.place(y=95, x=40)
-
-    btn_procurar = ctk.CTkButton(
-        tela_busca, text="Procurar", command=buscar_por_genero
-    )
-    btn_procurar.place(y=145, x=95)
-
-    btn_voltar = ctk.CTkButton(
-        tela_busca,
-        text="Voltar ao Menu Anterior",
-        text_color="black",
-        fg_color="#6D7B74",
-        hover_color="#55635C",
-        font=("Arial", 14, "underline"),
-        command=lambda: voltar_tela_inicial(tela_busca),
-    )
-    btn_voltar.place(y=5, x=5)
-
-    btn_sair = ctk.CTkButton(
-        tela_busca,
-        text="Sair",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=tela_busca.destroy,
-    )
-    btn_sair.place(y=220, x=95)
-
-    tela_busca.mainloop()
+    criar_tabela_resultados(frame, _COLUNAS_LIVRO, dados, _extrair_livro)
 
 
 def ter_resultado_genero(
-    dados: List[Dict[str, Any]], tela_anterior: ctk.CTk, genero: str
+    dados: List[Dict[str, Any]], tela_anterior: ctk.CTkFrame, genero: str
 ) -> None:
     """Exibir resultados de busca de livros por gênero."""
-    if not dados or not all("Autor" in livro and "NomeLivro" in livro for livro in dados):
+    if not dados or any(
+        "Autor" not in livro or "NomeLivro" not in livro for livro in dados
+    ):
         messagebox.showerror(
             "Erro",
             "Os dados retornados não contêm informações de livros. Verifique a API.",
@@ -961,7 +1214,7 @@ def ter_resultado_genero(
         logger.error(f"Dados inválidos recebidos para gênero '{genero}'")
         return
 
-    tela_resultado = ctk.CTkToplevel(fg_color="#000000")
+    tela_resultado = ctk.CTkToplevel(obter_raiz(), fg_color="#000000")
     tela_resultado.title(f"Resultado da Busca - Gênero: {genero}")
     tela_resultado.geometry("1200x600")
     tela_resultado.configure(bg="black")
@@ -969,16 +1222,12 @@ def ter_resultado_genero(
 
     def voltar() -> None:
         tela_resultado.destroy()
-        tela_anterior()
 
-    btn_voltar = ctk.CTkButton(
+    btn_voltar = criar_botao(
         tela_resultado,
-        text="Voltar ao Menu Anterior",
-        text_color="white",
-        fg_color="#000000",
-        hover_color="#575757",
-        font=("Arial", 14, "underline"),
-        command=voltar,
+        "Voltar ao Menu Anterior",
+        voltar,
+        estilo="voltar_resultado",
     )
     btn_voltar.place(y=10, x=10)
 
@@ -988,119 +1237,73 @@ def ter_resultado_genero(
 
     configurar_estilo_treeview(frame)
 
-    colunas = (
-        "Autor",
-        "NomeLivro",
-        "Genero",
-        "Idioma",
-        "QntdPagina",
-        "Editora",
-        "DataPublicacao",
-        "QntdDisponivel",
-    )
-
-    def extrair_dados_livro(livro: Dict[str, Any]) -> Tuple:
-        return (
-            livro.get("Autor", "N/A"),
-            livro.get("NomeLivro", "N/A"),
-            livro.get("genero", {}).get("NomeGenero", "N/A")
-            if livro.get("genero")
-            else "N/A",
-            livro.get("Idioma", "N/A"),
-            livro.get("QuantidadePaginas", "N/A"),
-            livro.get("Editora", "N/A"),
-            livro.get("DataPublicacao", "N/A"),
-            livro.get("QuantidadeDisponivel", "N/A"),
-        )
-
-    criar_tabela_resultados(frame, colunas, dados, extrair_dados_livro)
+    criar_tabela_resultados(frame, _COLUNAS_LIVRO, dados, _extrair_livro)
 
 
 # ==================== Cadastros ====================
-def pri_cadastro(tela_anterior: ctk.CTk) -> None:
+def pri_cadastro(tela_anterior: ctk.CTkFrame) -> None:
     """Menu primário de cadastros."""
-    tela_anterior.destroy()
-
-    tela_cadastro = CustomCTk(fg_color="#6D7B74")
-    tela_cadastro.title("Cadastros")
-    tela_cadastro.geometry("250x420")
+    tela_cadastro = abrir_tela("Cadastros", "250x420", fg_color="#6D7B74")
 
     opcao = ctk.CTkLabel(
         tela_cadastro, text="Escolha uma opção:", text_color="black"
     )
     opcao.place(y=120, x=70)
 
-    opcoes_cadastro = [
-        ("Cadastro Cliente", lambda: sec_cadastro_usuario(tela_cadastro), "#5F8D96"),
-        ("Cadastro Livro", lambda: sec_cadastro_livro(tela_cadastro), "#9CAD84"),
-    ]
-
-    y_pos = 150
-    for texto, comando, cor_hover in opcoes_cadastro:
-        btn = ctk.CTkButton(
-            tela_cadastro,
-            text=texto,
-            fg_color=COLOR_PRIMARY,
-            hover_color=cor_hover,
-            command=comando,
-        )
-        btn.place(y=y_pos, x=60)
-        y_pos += 35
+    criar_botoes_menu(tela_cadastro, _BOTOES_CADASTRO)
 
-    btn_voltar = ctk.CTkButton(
+    btn_voltar = criar_botao(
         tela_cadastro,
-        text="Voltar ao Menu Anterior",
-        text_color="black",
-        fg_color="#6D7B74",
-        hover_color="#55635C",
-        command=lambda: voltar_tela_inicial(tela_cadastro),
-        font=("Arial", 14, "underline"),
+        "Voltar ao Menu Anterior",
+        lambda: voltar_tela_inicial(tela_cadastro),
+        estilo="voltar",
     )
     btn_voltar.place(y=5, x=5)
 
-    btn_sair = ctk.CTkButton(
+    btn_sair = criar_botao(
         tela_cadastro,
-        text="Sair",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=tela_cadastro.destroy,
+        "Sair",
+        fechar_aplicacao,
+        estilo="sair",
     )
     btn_sair.place(y=380, x=105)
 
-    tela_cadastro.mainloop()
-
 
-def sec_cadastro_livro(tela_anterior: ctk.CTk) -> None:
+def sec_cadastro_livro(tela_anterior: ctk.CTkFrame) -> None:
     """Tela de cadastro de livro."""
-    tela_anterior.destroy()
-
-    tela_cadastro = CustomCTk(fg_color="#4E5D63")
-    tela_cadastro.title("Cadastro de Livro")
-    tela_cadastro.geometry("720x480")
+    tela_cadastro = abrir_tela(
+        "Cadastro de Livro", "720x480", fg_color="#4E5D63", adiar_exibicao=True
+    )
 
     def registrar_livro() -> None:
         """Enviar dados do livro para a API."""
-        # Extração de dados (implementar conforme necessário)
-        logger.info("Livro cadastrado com sucesso")
-        messagebox.showinfo("Sucesso", "Livro cadastrado com sucesso!")
+        nome_genero = combo_genero.get()
+        dados = {
+            "Autor": entradas["entry_autor"].get().strip(),
+            "NomeLivro": entradas["entry_nomelivro"].get().strip(),
+            "Editora": entradas["entry_nomeeditora"].get().strip(),
+            "DataPublicacao": entry_datapub.get().strip(),
+            "GeneroID": GENERO_POR_NOME.get(nome_genero.lower()),
+            "NomeGenero": nome_genero,
+            "QuantidadePaginas": entry_paginas.get().strip(),
+            "QuantidadeDisponivel": entry_quantidade.get().strip(),
+            "Idioma": entry_idioma.get().strip(),
+        }
+
+        sucesso, _, erro = fazer_requisicao_api("POST", "/livro", json_data=dados)
+
+        if sucesso:
+            logger.info("Livro cadastrado com sucesso")
+            messagebox.showinfo("Sucesso", "Livro cadastrado com sucesso!")
+        else:
+            messagebox.showerror("Erro", erro or "Erro ao cadastrar livro.")
 
     # Validação
-    validacao_cmd = tela_cadastro.register(validar_somente_inteiros)
+    validacao_cmd = obter_raiz().obter_validador_inteiros()
 
     # Campos do livro
-    campos = [
-        ("Digite o Autor/a:", "entry_autor"),
-        ("Digite o Nome do Livro:", "entry_nomelivro"),
-        ("Digite a Editora:", "entry_nomeeditora"),
-    ]
-
-    y_pos = 100
-    for label_text, _ in campos:
-        label = ctk.CTkLabel(tela_cadastro, text=label_text)
-        label.place(y=y_pos, x=100)
-        entry = ctk.CTkEntry(tela_cadastro, width=400, height=15)
-        entry.place(y=y_pos, x=230)
-        y_pos += 30
+    entradas = construir_formulario(tela_cadastro, _CAMPOS_LIVRO, 100, 100)
+    y_pos = 100 + 30 * len(_CAMPOS_LIVRO)
 
     # Data de publicação
     data_pub_label = ctk.CTkLabel(tela_cadastro, text="Digite a Data Publicada:")
@@ -1113,7 +1316,7 @@ def sec_cadastro_livro(tela_anterior: ctk.CTk) -> None:
         justify="center",
     )
     entry_datapub.place(y=y_pos, x=230)
-    entry_datapub._entry.bind("<FocusOut>", formatar_data_entrada)
+    marcar_entrada_data(entry_datapub)
     y_pos += 30
 
     # Gênero
@@ -1121,7 +1324,7 @@ def sec_cadastro_livro(tela_anterior: ctk.CTk) -> None:
     genero_label.place(y=y_pos, x=110)
     combo_genero = ctk.CTkComboBox(
         tela_cadastro,
-        values=[nome for _, nome in GENEROS],
+        values=LISTA_GENEROS_NOMES,
         width=400,
         height=15,
     )
@@ -1164,56 +1367,51 @@ def sec_cadastro_livro(tela_anterior: ctk.CTk) -> None:
     entry_idioma = ctk.CTkEntry(tela_cadastro, width=100, height=15)
     entry_idioma.place(y=y_pos, x=230)
 
-    btn_cadastrar = ctk.CTkButton(
-        tela_cadastro, text="Cadastrar", command=registrar_livro
-    )
+    btn_cadastrar = criar_botao(tela_cadastro, "Cadastrar", registrar_livro)
     btn_cadastrar.place(y=350, x=300)
 
-    btn_voltar = ctk.CTkButton(
+    btn_voltar = criar_botao(
         tela_cadastro,
-        text="Voltar ao Menu Anterior",
+        "Voltar ao Menu Anterior",
+        lambda: voltar_tela_inicial(tela_cadastro),
+        estilo="voltar_formulario",
         fg_color="#4E5D63",
         hover_color="#3B484D",
-        command=lambda: voltar_tela_inicial(tela_cadastro),
-        font=("Arial", 14, "underline"),
     )
     btn_voltar.place(y=15, x=15)
 
-    btn_fechar = ctk.CTkButton(
+    btn_fechar = criar_botao(
         tela_cadastro,
-        text="Fechar",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=tela_cadastro.destroy,
+        "Fechar",
+        fechar_aplicacao,
+        estilo="sair",
     )
     btn_fechar.place(y=430, x=280)
 
-    tela_cadastro.mainloop()
+    exibir_tela_pendente()
 
 
-def sec_cadastro_usuario(tela_anterior: ctk.CTk) -> None:
+def sec_cadastro_usuario(tela_anterior: ctk.CTkFrame) -> None:
     """Tela de cadastro de usuário."""
-    tela_anterior.destroy()
-
-    tela_cadastro = CustomCTk(fg_color="#4A5C63")
-    tela_cadastro.title("Cadastro de Cliente")
-    tela_cadastro.geometry("720x480")
+    tela_cadastro = abrir_tela(
+        "Cadastro de Cliente", "720x480", fg_color="#4A5C63", adiar_exibicao=True
+    )
 
     def registrar_usuario() -> None:
         """Enviar dados do usuário para a API."""
         dados = {
-            "Nome": "",  # entry_nome.get()
-            "Sobrenome": "",  # entry_sobrenome.get()
-            "CPF": "",  # entry_cpf.get()
-            "DataNascimento": "",  # entry_datanascimento.get()
-            "DataAfiliacao": "",  # entry_dataafiliacao.get()
-            "CEP": "",  # entry_cep.get()
-            "Rua": "",  # entry_rua.get()
-            "Numero": "",  # entry_numero.get()
-            "Bairro": "",  # entry_bairro.get()
-            "Cidade": "",  # entry_cidade.get()
-            "Estado": "",  # entry_estado.get()
-            "Complemento": "",  # entry_complemento.get()
+            "Nome": entradas["entry_nome"].get().strip(),
+            "Sobrenome": entradas["entry_sobrenome"].get().strip(),
+            "CPF": entradas["entry_cpf"].get().strip(),
+            "DataNascimento": entradas["entry_datanascimento"].get().strip(),
+            "DataAfiliacao": entradas["entry_dataafiliacao"].get().strip(),
+            "CEP": entradas["entry_cep"].get().strip(),
+            "Rua": entradas["entry_rua"].get().strip(),
+            "Numero": entradas["entry_numero"].get().strip(),
+            "Bairro": entradas["entry_bairro"].get().strip(),
+            "Cidade": entradas["entry_cidade"].get().strip(),
+            "Estado": entradas["entry_estado"].get().strip(),
+            "Complemento": entradas["entry_complemento"].get().strip(),
         }
 
         sucesso, _, erro = fazer_requisicao_api("POST", "/cliente", json_data=dados)
@@ -1223,132 +1421,87 @@ def sec_cadastro_usuario(tela_anterior: ctk.CTk) -> None:
         else:
             messagebox.showerror("Erro", erro or "Erro ao cadastrar usuário.")
 
-    # Validação
-    validacao_cmd = tela_cadastro.register(validar_somente_inteiros)
-
     # Campos do usuário
-    campos_usuario = [
-        ("Digite o Nome:", "entry_nome"),
-        ("Digite o Sobrenome:", "entry_sobrenome"),
-        ("Digite o CPF:", "entry_cpf"),
-        ("Digite a Data de Nascimento:", "entry_datanascimento"),
-        ("Digite a Data de Afiliação:", "entry_dataafiliacao"),
-        ("Digite o CEP:", "entry_cep"),
-        ("Digite a Rua:", "entry_rua"),
-        ("Digite o Número:", "entry_numero"),
-        ("Digite o Bairro:", "entry_bairro"),
-        ("Digite a Cidade:", "entry_cidade"),
-        ("Digite o Estado:", "entry_estado"),
-        ("Digite o Complemento (Se Tiver):", "entry_complemento"),
-    ]
-
-    y_pos = 50
-    for label_text, _ in campos_usuario:
-        label = ctk.CTkLabel(tela_cadastro, text=label_text)
-        label.place(y=y_pos, x=50)
-        entry = ctk.CTkEntry(tela_cadastro, width=250, height=15)
-        entry.place(y=y_pos, x=230)
-        y_pos += 30
-
-    btn_cadastrar = ctk.CTkButton(
-        tela_cadastro, text="Cadastrar", command=registrar_usuario
+    entradas = construir_formulario(
+        tela_cadastro,
+        _CAMPOS_USUARIO,
+        50,
+        50,
+        opcoes_entrada={"width": 250, "height": 15},
     )
+
+    btn_cadastrar = criar_botao(tela_cadastro, "Cadastrar", registrar_usuario)
     btn_cadastrar.place(y=425, x=200)
 
-    btn_voltar = ctk.CTkButton(
+    btn_voltar = criar_botao(
         tela_cadastro,
-        text="Voltar ao Menu Anterior",
+        "Voltar ao Menu Anterior",
+        lambda: voltar_tela_inicial(tela_cadastro),
+        estilo="voltar_formulario",
         fg_color="#4A5C63",
         hover_color="#3C474D",
-        command=lambda: voltar_tela_inicial(tela_cadastro),
-        font=("Arial", 14, "underline"),
     )
     btn_voltar.place(y=15, x=15)
 
-    btn_fechar = ctk.CTkButton(
+    btn_fechar = criar_botao(
         tela_cadastro,
-        text="Fechar",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=tela_cadastro.destroy,
+        "Fechar",
+        fechar_aplicacao,
+        estilo="sair",
     )
     btn_fechar.place(y=425, x=360)
 
-    tela_cadastro.mainloop()
+    exibir_tela_pendente()
 
 
 # ==================== Reservas ====================
-def pri_reserva(tela_anterior: ctk.CTk) -> None:
+def pri_reserva(tela_anterior: ctk.CTkFrame) -> None:
     """Menu primário de reservas."""
-    tela_anterior.destroy()
-
-    tela_reservas = CustomCTk(fg_color="#B89778")
-    tela_reservas.title("Reservas")
-    tela_reservas.geometry("250x420")
+    tela_reservas = abrir_tela("Reservas", "250x420", fg_color="#B89778")
 
     opcao = ctk.CTkLabel(
         tela_reservas, text="Escolha uma opção:", text_color="black"
     )
     opcao.place(y=120, x=70)
 
-    btn_consultar = ctk.CTkButton(
-        tela_reservas,
-        text="Consultar Reservas",
-        fg_color=COLOR_PRIMARY,
-        hover_color="#1B263B",
-    )
-    btn_consultar.place(y=150, x=60)
-
-    btn_nova_reserva = ctk.CTkButton(
-        tela_reservas,
-        text="Nova Reserva",
-        fg_color=COLOR_PRIMARY,
-        hover_color="#A0522D",
-        command=lambda: sec_nova_reserva(tela_reservas),
-    )
-    btn_nova_reserva.place(y=185, x=60)
+    criar_botoes_menu(tela_reservas, _BOTOES_RESERVA)
 
-    btn_voltar = ctk.CTkButton(
+    btn_voltar = criar_botao(
         tela_reservas,
-        text="Voltar ao Menu Anterior",
+        "Voltar ao Menu Anterior",
+        lambda: voltar_tela_inicial(tela_reservas),
+        estilo="voltar_formulario",
         text_color="black",
         fg_color="#B89778",
         hover_color="#A0522D",
-        command=lambda: voltar_tela_inicial(tela_reservas),
-        font=("Arial", 14, "underline"),
     )
     btn_voltar.place(y=5, x=5)
 
-    btn_sair = ctk.CTkButton(
+    btn_sair = criar_botao(
         tela_reservas,
-        text="Sair",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=tela_reservas.destroy,
+        "Sair",
+        fechar_aplicacao,
+        estilo="sair",
     )
     btn_sair.place(y=385, x=105)
 
-    tela_reservas.mainloop()
-
 
-def sec_nova_reserva(tela_anterior: ctk.CTk) -> None:
+def sec_nova_reserva(tela_anterior: ctk.CTkFrame) -> None:
     """Tela de nova reserva."""
-    tela_anterior.destroy()
-
-    tela_reserva = CustomCTk(fg_color=COLOR_SECONDARY)
-    tela_reserva.title("Nova Reserva")
-    tela_reserva.geometry("720x480")
+    tela_reserva = abrir_tela(
+        "Nova Reserva", "720x480", fg_color=COLOR_SECONDARY, adiar_exibicao=True
+    )
 
     def registrar_reserva() -> None:
         """Enviar dados da reserva para a API."""
         dados = {
-            "CPFReserva": "",  # entry_cpfreserva.get()
-            "NomeLivro": "",  # entry_nomelivro.get()
-            "QntdLivro": "",  # entry_qntdlivro.get()
-            "DataRetirada": "",  # entry_dataretirada.get()
-            "DataVolta": "",  # entry_datavolta.get()
-            "Entrega": "",  # entry_retirada.get()
-            "Observacao": "",  # entry_observacao.get()
+            "CPFReserva": entradas["entry_cpfreserva"].get().strip(),
+            "NomeLivro": entradas["entry_nomelivro"].get().strip(),
+            "QntdLivro": entradas["entry_qntdlivro"].get().strip(),
+            "DataRetirada": entradas["entry_dataretirada"].get().strip(),
+            "DataVolta": entradas["entry_datavolta"].get().strip(),
+            "Entrega": entradas["entry_retirada"].get().strip(),
+            "Observacao": entradas["entry_observacao"].get().strip(),
         }
 
         sucesso, _, erro = fazer_requisicao_api("POST", "/reservas", json_data=dados)
@@ -1358,66 +1511,52 @@ def sec_nova_reserva(tela_anterior: ctk.CTk) -> None:
         else:
             messagebox.showerror("Erro", erro or "Erro ao cadastrar reserva.")
 
-    validacao_cmd = tela_reserva.register(validar_somente_inteiros)
-
-    campos_reserva = [
-        ("Digite o CPF:", "entry_cpfreserva", False),
-        ("Digite o Nome do Livro:", "entry_nomelivro", False),
-        ("Digite a Quantidade:", "entry_qntdlivro", True),
-        ("Digite a Data da Retirada:", "entry_dataretirada", False),
-        ("Digite a Data Prevista para Volta:", "entry_datavolta", False),
-        ("Digite a forma de retirada:", "entry_retirada", False),
-        ("Observação da Reserva:", "entry_observacao", False),
-    ]
-
-    y_pos = 100
-    for label_text, _, _ in campos_reserva:
-        label = ctk.CTkLabel(tela_reserva, text=label_text, text_color=COLOR_TEXT)
-        label.place(y=y_pos, x=50)
-        entry = ctk.CTkEntry(tela_reserva, width=400, height=15)
-        entry.place(y=y_pos, x=230)
-        y_pos += 30
-
-    btn_voltar = ctk.CTkButton(
+    validacao_cmd = obter_raiz().obter_validador_inteiros()
+
+    entradas = construir_formulario(
         tela_reserva,
-        text="Voltar ao Menu Anterior",
+        _CAMPOS_RESERVA,
+        100,
+        50,
+        opcoes_rotulo={"text_color": COLOR_TEXT},
+        validacao_inteiros=validacao_cmd,
+    )
+
+    btn_voltar = criar_botao(
+        tela_reserva,
+        "Voltar ao Menu Anterior",
+        lambda: pri_reserva(tela_reserva),
+        estilo="voltar_formulario",
         fg_color=COLOR_SECONDARY,
         hover_color="#121212",
-        command=lambda: pri_reserva(tela_reserva),
-        font=("Arial", 14, "underline"),
     )
     btn_voltar.place(y=15, x=15)
 
-    btn_fechar = ctk.CTkButton(
+    btn_fechar = criar_botao(
         tela_reserva,
-        text="Fechar",
-        fg_color=COLOR_PRIMARY,
+        "Fechar",
+        fechar_aplicacao,
+        estilo="sair",
         text_color=COLOR_TEXT,
-        hover_color=COLOR_ERROR,
-        command=tela_reserva.destroy,
     )
     btn_fechar.place(y=430, x=280)
 
-    btn_reservar = ctk.CTkButton(
+    btn_reservar = criar_botao(
         tela_reserva,
-        text="Reservar",
+        "Reservar",
+        registrar_reserva,
         fg_color="#1E5128",
         hover_color="#4E9F3D",
-        command=registrar_reserva,
     )
     btn_reservar.place(y=430, x=400)
 
-    tela_reserva.mainloop()
+    exibir_tela_pendente()
 
 
 # ==================== Exclusão ====================
-def pri_exclusao(tela_anterior: ctk.CTk) -> None:
+def pri_exclusao(tela_anterior: ctk.CTkFrame) -> None:
     """Menu de exclusão (em desenvolvimento)."""
-    tela_anterior.destroy()
-
-    tela_exclusao = CustomCTk()
-    tela_exclusao.title("Exclusão de Registros")
-    tela_exclusao.geometry("1080x720")
+    tela_exclusao = abrir_tela("Exclusão de Registros", "1080x720")
 
     label_info = ctk.CTkLabel(
         tela_exclusao,
@@ -1426,19 +1565,17 @@ def pri_exclusao(tela_anterior: ctk.CTk) -> None:
     )
     label_info.place(y=300, x=300)
 
-    btn_sair = ctk.CTkButton(
+    btn_sair = criar_botao(
         tela_exclusao,
-        text="Sair",
-        fg_color=COLOR_PRIMARY,
-        hover_color=COLOR_ERROR,
-        command=lambda: voltar_tela_inicial(tela_exclusao),
+        "Sair",
+        lambda: voltar_tela_inicial(tela_exclusao),
+        estilo="sair",
     )
     btn_sair.place(y=385, x=105)
 
-    tela_exclusao.mainloop()
-
 
 # ==================== Ponto de Entrada ====================
 if __name__ == "__main__":
     logger.info("Iniciando Sistema de Biblioteca")
     tela_inicial()
+    obter_raiz().mainloop()
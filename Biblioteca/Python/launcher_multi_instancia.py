@@ -4,12 +4,15 @@ Permite rodar 2, 3, 4 ou mais janelas da aplicação em paralelo
 """
 
 import customtkinter as ctk
+import subprocess
 from subprocess import Popen
 import sys
 import os
-from threading import Thread
 import json
-from datetime import datetime
+import time
+from pathlib import Path
+
+from app import BibliotecaApp
 
 
 class LauncherMultiInstancia:
@@ -34,9 +37,26 @@ class LauncherMultiInstancia:
         
         self.janela_principal.configure(fg_color=self.cores['bg_principal'])
         
+        # Caminhos do modo isolado resolvidos uma vez (relativos a este arquivo)
+        aqui = Path(__file__).resolve().parent
+        self._app_path = str(aqui / "app.py")
+        self._py = sys.executable
+        # No Windows, não anexar um console a cada filho
+        self._flags_filho = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        
+        # Ambiente dos processos filhos: sem gravar .pyc e com saída sem buffer
+        self._env_filho = os.environ.copy()
+        self._env_filho['PYTHONDONTWRITEBYTECODE'] = '1'
+        self._env_filho['PYTHONUNBUFFERED'] = '1'
+        
         # Controlar instâncias
         self.instancias_ativas = []
         self.numero_instancia = 0
+        self._ultima_lista = None  # números das instâncias na última renderização
+        
+        # Por padrão as instâncias são janelas no mesmo processo; processos
+        # separados só quando o usuário pede isolamento explicitamente
+        self.processos_isolados = ctk.BooleanVar(value=False)
         
         self.criar_interface()
     
@@ -114,6 +134,15 @@ class LauncherMultiInstancia:
         )
         btn_nova.pack(fill="x", pady=10)
         
+        chk_isolados = ctk.CTkCheckBox(
+            frame_botoes,
+            text="Abrir como processos separados (isolados)",
+            variable=self.processos_isolados,
+            font=("Segoe UI", 11),
+            text_color=self.cores['text']
+        )
+        chk_isolados.pack(anchor="w")
+        
         # ==================== ATALHOS ====================
         frame_atalhos = ctk.CTkFrame(self.janela_principal, fg_color="transparent")
         frame_atalhos.pack(fill="x", padx=30, pady=5)
@@ -155,19 +184,26 @@ class LauncherMultiInstancia:
         )
         label_lista.pack(pady=(10, 5), padx=15, anchor="w")
         
-        # Text widget para mostrar instâncias
-        self.text_instancias = ctk.CTkTextbox(
+        # Label para mostrar instâncias (atualizada com um único configure)
+        frame_instancias = ctk.CTkFrame(
             frame_lista,
             fg_color=self.cores['bg_principal'],
-            text_color=self.cores['text'],
             border_color=self.cores['accent'],
             border_width=2,
             corner_radius=8,
-            height=150,
-            font=("Courier", 10)
+            height=150
         )
-        self.text_instancias.pack(fill="both", expand=True, padx=10, pady=10)
-        self.text_instancias.configure(state="disabled")
+        frame_instancias.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        self.label_instancias = ctk.CTkLabel(
+            frame_instancias,
+            text="",
+            text_color=self.cores['text'],
+            font=("Courier", 10),
+            justify="left",
+            anchor="nw"
+        )
+        self.label_instancias.pack(fill="both", expand=True, padx=8, pady=8)
         
         # ==================== BOTÕES DE AÇÃO ====================
         frame_acao = ctk.CTkFrame(self.janela_principal, fg_color="transparent")
@@ -211,41 +247,81 @@ class LauncherMultiInstancia:
         
         # Atualizar lista inicial
         self.atualizar_lista()
+        
+        # Um único verificador no loop do Tk acompanha os processos isolados
+        self._verificar_processos()
     
     def abrir_nova_instancia(self):
         """Abrir uma nova instância da aplicação"""
-        self.numero_instancia += 1
-        
-        thread = Thread(
-            target=self._iniciar_instancia,
-            args=(self.numero_instancia,),
-            daemon=True
-        )
-        thread.start()
-        
-        self.atualizar_lista()
+        self.abrir_n_instancias(1)
     
     def abrir_n_instancias(self, n):
         """Abrir n instâncias simultaneamente"""
+        # Modo lido uma vez; todas as instâncias são abertas em sequência
+        # e a lista é redesenhada só no final do lote
+        iniciar = self._iniciar_processo if self.processos_isolados.get() else self._iniciar_instancia
+        inicio = time.strftime("%H:%M:%S")
         for _ in range(n):
-            self.abrir_nova_instancia()
+            self.numero_instancia += 1
+            iniciar(self.numero_instancia, inicio)
+        
+        self.atualizar_lista()
     
-    def _iniciar_instancia(self, numero):
-        """Iniciar uma instância em thread separada"""
+    def _iniciar_instancia(self, numero, inicio):
+        """Abrir uma instância como janela (CTkToplevel) neste mesmo processo"""
         try:
-            caminho_app = r"c:\Users\gabel\Documents\Programação\VsCode\Prj - Grandes\sis.biblioteca-prt\Biblioteca\Python\app_melhorado.py"
+            app = BibliotecaApp(master=self.janela_principal)
+            app.janela.title(f"📚 Sistema de Biblioteca - Instância #{numero}")
+            
+            self.instancias_ativas.append({
+                'numero': numero,
+                'pid': None,
+                'inicio': inicio,
+                'janela': app.janela
+            })
+            
+            app.janela.bind(
+                "<Destroy>",
+                lambda evento, janela=app.janela, n=numero: self._ao_fechar_janela(evento, janela, n),
+                add="+"
+            )
+            
+            self.label_status.configure(text=f"✅ Instância #{numero} aberta")
             
+        except Exception as e:
+            self.label_status.configure(
+                text=f"❌ Erro ao abrir instância: {str(e)}",
+                text_color=self.cores['vermelho']
+            )
+    
+    def _ao_fechar_janela(self, evento, janela, numero):
+        """Remover da lista a instância cuja janela foi fechada"""
+        # <Destroy> também chega pelos widgets filhos; interessa só a janela
+        if evento.widget is not janela:
+            return
+        self.instancias_ativas = [
+            inst for inst in self.instancias_ativas
+            if inst['numero'] != numero
+        ]
+        if self.janela_principal.winfo_exists():
+            self.atualizar_lista()
+    
+    def _iniciar_processo(self, numero, inicio):
+        """Iniciar uma instância isolada em outro processo (sem bloquear)"""
+        try:
             # Abrir nova instância
             processo = Popen(
-                [sys.executable, caminho_app],
-                cwd=r"c:\Users\gabel\Documents\Programação\VsCode\Prj - Grandes\sis.biblioteca-prt\Biblioteca\Python"
+                [self._py, self._app_path],
+                env=self._env_filho,
+                close_fds=True,
+                creationflags=self._flags_filho
             )
             
             # Registrar instância
             info_instancia = {
                 'numero': numero,
                 'pid': processo.pid,
-                'inicio': datetime.now().strftime("%H:%M:%S"),
+                'inicio': inicio,
                 'processo': processo
             }
             
@@ -255,39 +331,43 @@ class LauncherMultiInstancia:
                 text=f"✅ Instância #{numero} aberta (PID: {processo.pid})"
             )
             
-            # Aguardar encerramento
-            processo.wait()
-            
-            # Remover quando encerrar
-            self.instancias_ativas = [
-                inst for inst in self.instancias_ativas 
-                if inst['pid'] != processo.pid
-            ]
-            
-            self.atualizar_lista()
-            
         except Exception as e:
             self.label_status.configure(
                 text=f"❌ Erro ao abrir instância: {str(e)}",
                 text_color=self.cores['vermelho']
             )
     
+    def _verificar_processos(self):
+        """Remover processos encerrados da lista (verificação periódica via after)"""
+        ativas = [
+            inst for inst in self.instancias_ativas
+            if 'processo' not in inst or inst['processo'].poll() is None
+        ]
+        if len(ativas) != len(self.instancias_ativas):
+            self.instancias_ativas = ativas
+            self.atualizar_lista()
+        self.janela_principal.after(500, self._verificar_processos)
+    
     def atualizar_lista(self):
-        """Atualizar lista de instâncias ativas"""
-        self.text_instancias.configure(state="normal")
-        self.text_instancias.delete("1.0", "end")
+        """Atualizar lista de instâncias ativas (só redesenha se ela mudou)"""
+        numeros = tuple(inst['numero'] for inst in self.instancias_ativas)
+        if numeros == self._ultima_lista:
+            return
+        self._ultima_lista = numeros
         
         if not self.instancias_ativas:
-            self.text_instancias.insert("end", "Nenhuma instância aberta\n")
+            bloco = "Nenhuma instância aberta"
         else:
-            self.text_instancias.insert("end", "ID  │ PID      │ Inicializada\n")
-            self.text_instancias.insert("end", "────┼──────────┼──────────────\n")
-            
+            linhas = [
+                "ID  │ PID      │ Inicializada",
+                "────┼──────────┼──────────────",
+            ]
             for inst in self.instancias_ativas:
-                linha = f" #{inst['numero']:2d} │ {inst['pid']:8d} │ {inst['inicio']}\n"
-                self.text_instancias.insert("end", linha)
+                pid = f"{inst['pid']:8d}" if inst['pid'] is not None else "  janela"
+                linhas.append(f" #{inst['numero']:2d} │ {pid} │ {inst['inicio']}")
+            bloco = "\n".join(linhas)
         
-        self.text_instancias.configure(state="disabled")
+        self.label_instancias.configure(text=bloco)
         
         # Atualizar contador
         total = len(self.instancias_ativas)
@@ -326,9 +406,12 @@ class LauncherMultiInstancia:
         frame_btns.pack(fill="x", padx=30, pady=20)
         
         def confirmar():
-            for inst in self.instancias_ativas:
+            for inst in list(self.instancias_ativas):
                 try:
-                    inst['processo'].terminate()
+                    if 'janela' in inst:
+                        inst['janela'].destroy()
+                    else:
+                        inst['processo'].terminate()
                 except:
                     pass
             
@@ -7,6 +7,7 @@ Versão: 2.0 com arquitetura modularizada
 import os
 import sys
 import logging
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 # Configurar paths
@@ -18,7 +19,10 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('biblioteca.log'),
+        # delay=True: o arquivo só é aberto na primeira gravação
+        RotatingFileHandler(
+            'biblioteca.log', maxBytes=1_000_000, backupCount=3, delay=True
+        ),
         logging.StreamHandler()
     ]
 )
@@ -40,11 +44,11 @@ def iniciar_aplicacao():
         logger.info("Aplicação finalizada com sucesso")
         
     except ImportError as e:
-        logger.error(f"Erro ao importar módulos: {e}")
+        logger.error("Erro ao importar módulos: %s", e)
         print(f"❌ Erro ao carregar módulos: {e}")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Erro durante execução: {e}", exc_info=True)
+        logger.error("Erro durante execução: %s", e, exc_info=True)
         print(f"❌ Erro na aplicação: {e}")
         sys.exit(1)
 
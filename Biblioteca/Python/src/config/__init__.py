@@ -17,8 +17,3 @@ __all__ = [
     "GENEROS",
     "COLORS",
 ]
-
-__all__ = [
-    'API_BASE_URL', 'API_TIMEOUT', 'THEME_MODE', 'THEME_COLOR',
-    'GENEROS', 'COLORS'
-]
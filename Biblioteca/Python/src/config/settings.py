@@ -2,8 +2,19 @@
 Configurações globais da aplicação
 """
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
+# Pasta do projeto (onde ficam app.py e main.py): base dos caminhos relativos
+_PASTA_PROJETO = Path(__file__).resolve().parents[2]
+
+
+def _caminho_no_projeto(valor: str) -> str:
+    """Resolver um caminho relativo a partir da pasta do projeto ('' continua vazio)."""
+    valor = valor.strip()
+    return str(_PASTA_PROJETO / valor) if valor else ''
+
+
 load_dotenv()
 
 # API Configuration
@@ -11,6 +22,8 @@ API_BASE_URL = os.getenv('API_BASE_URL', 'http://localhost:3000')
 API_TIMEOUT = int(os.getenv('API_TIMEOUT', '10'))
 API_AUTH_EMAIL = os.getenv('API_AUTH_EMAIL', '').strip()
 API_AUTH_PASSWORD = os.getenv('API_AUTH_PASSWORD', '').strip()
+# Cookies da sessão HTTP mantidos entre execuções (vazio desativa)
+API_COOKIES_FILE = _caminho_no_projeto(os.getenv('API_COOKIES_FILE', '.api_cookies.json'))
 OPERATOR_PASSWORD = os.getenv('OPERATOR_PASSWORD', '4321').strip()
 
 # UI Configuration
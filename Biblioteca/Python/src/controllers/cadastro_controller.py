@@ -4,10 +4,62 @@ Controllers para operações de cadastro
 from typing import Tuple, Dict, Optional
 
 from src.models.api_client import api_client
-from src.utils.validators import Validators, sanitizar_entrada
+from src.utils.validators import Validators, sanitizar_entrada_memo
 from src.utils.formatters import normalizar_data_para_api
 
 
+# Separadores usuais de CPF, removidos antes da checagem rápida de tamanho
+_SEPARADORES_CPF = str.maketrans('', '', '.-/ ')
+
+
+def _pre_validar_cpf(cpf: str) -> bool:
+    """Descartar sem regex CPFs que não têm 11 dígitos; senão, usar o Validators."""
+    if len(cpf) < 11:
+        return False
+    digitos = cpf.translate(_SEPARADORES_CPF)
+    if digitos.isdigit() and len(digitos) != 11:
+        return False
+    return Validators.validar_cpf(cpf)
+
+
+def _pre_validar_cep(cep: str) -> bool:
+    """CEP tem 8 ou 9 caracteres (XXXXXXXX ou XXXXX-XXX); senão nem chega à regex."""
+    return len(cep) in (8, 9) and Validators.validar_cep(cep)
+
+
+def _pre_validar_data(data: str) -> bool:
+    """DD/MM/AAAA ou DD/MM/AA sempre tem barras e de 6 a 10 caracteres."""
+    return 6 <= len(data) <= 10 and '/' in data and Validators.validar_data(data)
+
+
+# Campos de data normalizados para o formato da API antes do envio
+_DATAS_CLIENTE = frozenset({'DataNascimento', 'DataAfiliacao'})
+_DATAS_RESERVA = frozenset({'DataRetirada', 'DataVolta'})
+
+
+def _normalizar_data(valor):
+    """Normaliza a data para a API, pulando as que já estão em DD/MM/AAAA."""
+    # Mesmo formato de saída (API_OUTPUT_FORMAT): o strptime+strftime devolveria
+    # a própria string. Anos com zero à esquerda ficam de fora (strftime não
+    # preserva o zero)
+    if (isinstance(valor, str) and len(valor) == 10 and valor[2] == '/' and valor[5] == '/'
+            and valor[6] != '0' and (valor[:2] + valor[3:5] + valor[6:]).isdigit()):
+        return valor
+    return normalizar_data_para_api(valor)
+
+
+def _formatar_dados(dados: Dict, chaves_data: frozenset) -> Dict:
+    """Normalizar datas e sanitizar textos numa única passada pelo dicionário."""
+    formatados = {}
+    for chave, valor in dados.items():
+        if chave in chaves_data:
+            valor = _normalizar_data(valor)
+        if isinstance(valor, str):
+            valor = sanitizar_entrada_memo(valor)
+        formatados[chave] = valor
+    return formatados
+
+
 class APIClient:
     """Façade para permitir patching nos testes.
 
@@ -42,19 +94,19 @@ class CadastroController:
 
         # Ordem escolhida para bater com a suíte de testes (data antes de CPF)
         data_nascimento = str(dados.get('DataNascimento', '')).strip()
-        if data_nascimento and not Validators.validar_data(data_nascimento):
+        if data_nascimento and not _pre_validar_data(data_nascimento):
             return False, 'Data de nascimento inválida'
 
         data_afil = str(dados.get('DataAfiliacao', '')).strip()
-        if data_afil and not Validators.validar_data(data_afil):
+        if data_afil and not _pre_validar_data(data_afil):
             return False, 'Data de afiliação inválida'
 
         cpf = str(dados.get('CPF', '')).strip()
-        if cpf and not Validators.validar_cpf(cpf):
+        if cpf and not _pre_validar_cpf(cpf):
             return False, 'CPF inválido'
 
         cep = str(dados.get('CEP', '')).strip()
-        if cep and not Validators.validar_cep(cep):
+        if cep and not _pre_validar_cep(cep):
             return False, 'CEP inválido'
         
         return True, ''
@@ -75,16 +127,8 @@ class CadastroController:
         if not valido:
             return False, erro
         
-        dados_formatados = dados.copy()
-        if 'DataNascimento' in dados_formatados:
-            dados_formatados['DataNascimento'] = normalizar_data_para_api(dados_formatados['DataNascimento'])
-        if 'DataAfiliacao' in dados_formatados:
-            dados_formatados['DataAfiliacao'] = normalizar_data_para_api(dados_formatados['DataAfiliacao'])
-        
-        # Sanitizar entrada
-        for chave in dados_formatados:
-            if isinstance(dados_formatados[chave], str):
-                dados_formatados[chave] = sanitizar_entrada(dados_formatados[chave])
+        # Normalizar datas e sanitizar entrada
+        dados_formatados = _formatar_dados(dados, _DATAS_CLIENTE)
         
         # Fazer requisição
         sucesso, _resposta, erro = APIClient.post('/cliente', json=dados_formatados)
@@ -109,15 +153,15 @@ class CadastroController:
             return False, 'NomeLivro é obrigatório'
 
         data_retirada = str(dados.get('DataRetirada', '')).strip()
-        if data_retirada and not Validators.validar_data(data_retirada):
+        if data_retirada and not _pre_validar_data(data_retirada):
             return False, 'Data de retirada inválida'
 
         data_volta = str(dados.get('DataVolta', '')).strip()
-        if data_volta and not Validators.validar_data(data_volta):
+        if data_volta and not _pre_validar_data(data_volta):
             return False, 'Data de volta inválida'
 
         cpf = str(dados.get('CPFReserva', '')).strip()
-        if cpf and not Validators.validar_cpf(cpf):
+        if cpf and not _pre_validar_cpf(cpf):
             return False, 'CPF inválido'
         
         # Validar quantidade
@@ -148,16 +192,8 @@ class CadastroController:
         if not valido:
             return False, erro
         
-        dados_formatados = dados.copy()
-        if 'DataRetirada' in dados_formatados:
-            dados_formatados['DataRetirada'] = normalizar_data_para_api(dados_formatados['DataRetirada'])
-        if 'DataVolta' in dados_formatados:
-            dados_formatados['DataVolta'] = normalizar_data_para_api(dados_formatados['DataVolta'])
-        
-        # Sanitizar entrada
-        for chave in dados_formatados:
-            if isinstance(dados_formatados[chave], str):
-                dados_formatados[chave] = sanitizar_entrada(dados_formatados[chave])
+        # Normalizar datas e sanitizar entrada
+        dados_formatados = _formatar_dados(dados, _DATAS_RESERVA)
         
         # Fazer requisição
         sucesso, _resposta, erro = APIClient.post('/reservas', json=dados_formatados)
@@ -4,7 +4,7 @@ Controllers para consultas de dados
 from typing import Tuple, List, Dict, Optional
 
 from src.models.api_client import api_client
-from src.utils.validators import sanitizar_entrada
+from src.utils.validators import sanitizar_entrada_memo
 
 
 class APIClient:
@@ -43,7 +43,7 @@ class ConsultaController:
         """
         params = None
         if isinstance(nome, str) and nome.strip():
-            params = {'Nome': sanitizar_entrada(nome)}
+            params = {'Nome': sanitizar_entrada_memo(nome)}
         return APIClient.get('/cliente', params=params)
     
     @staticmethod
@@ -59,7 +59,7 @@ class ConsultaController:
         """
         params = None
         if isinstance(estado, str) and estado.strip():
-            params = {'Estado': sanitizar_entrada(estado)}
+            params = {'Estado': sanitizar_entrada_memo(estado)}
         return APIClient.get('/endereco', params=params)
     
     @staticmethod
@@ -75,7 +75,7 @@ class ConsultaController:
         """
         params = None
         if isinstance(nome_livro, str) and nome_livro.strip():
-            params = {'NomeLivro': sanitizar_entrada(nome_livro)}
+            params = {'NomeLivro': sanitizar_entrada_memo(nome_livro)}
         return APIClient.get('/livro', params=params)
     
     @staticmethod
@@ -91,7 +91,7 @@ class ConsultaController:
         """
         params = None
         if isinstance(nome_autor, str) and nome_autor.strip():
-            params = {'NomeAutor': sanitizar_entrada(nome_autor)}
+            params = {'NomeAutor': sanitizar_entrada_memo(nome_autor)}
         return APIClient.get('/livro/autor', params=params)
     
     @staticmethod
@@ -107,5 +107,5 @@ class ConsultaController:
         """
         params = None
         if isinstance(nome_genero, str) and nome_genero.strip():
-            params = {'NomeGenero': sanitizar_entrada(nome_genero)}
+            params = {'NomeGenero': sanitizar_entrada_memo(nome_genero)}
         return APIClient.get('/genero', params=params)
@@ -2,19 +2,140 @@
 
 from __future__ import annotations
 
+import re
+import sys
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.models.api_client import APIClient
 from src.utils.formatters import (
-    formatar_data_para_exibicao,
+    DISPLAY_DATA_FORMAT,
     interpretar_data,
     formatar_valor_monetario,
     interpretar_valor_monetario,
 )
 
 
+# Status de multa; os vindos da API são internados para que a comparação com
+# estas constantes resolva pela identidade do objeto
+STATUS_PAGA = 'Paga'
+STATUS_VENCIDA = 'Vencida'
+STATUS_PENDENTE = 'Pendente'
+
+_CENTAVOS = Decimal('0.01')
+_ZERO = Decimal('0')
+
+# Formatos aceitos, em ordem fixa (o padrão de interpretar_data vem de um set).
+# Não se sobrepõem: %y exige dois dígitos de ano e %Y exige quatro
+_FORMATOS_DATA_MULTA = ('%Y-%m-%d', '%d/%m/%y', '%d/%m/%Y')
+
+
+# Datas de vencimento/pagamento se repetem entre multas e entre consultas;
+# datetime é imutável, então o resultado pode ser compartilhado
+@lru_cache(maxsize=1024)
+def _interpretar_data_memo(valor: Optional[str]) -> Optional[datetime]:
+    return interpretar_data(valor, _FORMATOS_DATA_MULTA)
+
+
+# Valor monetário como a API costuma enviar (coluna DECIMAL): "123.45"
+_VALOR_DUAS_CASAS_RE = re.compile(r'-?\d+\.\d\d')
+
+
+# Grafias aceitas (API atual / legada) para os campos com apelido
+_CHAVES_MULTA_ID = ('MultaID', 'multa_id')
+_CHAVES_RESERVA_ID = ('ReservaID', 'reserva_id')
+_CHAVES_CLIENTE_ID = ('ClienteID', 'cliente_id')
+_CHAVES_STATUS = ('Status', 'status')
+_CHAVES_VENCIMENTO = ('DataVencimento', 'data_vencimento')
+_CHAVES_PAGAMENTO = ('DataPagamento', 'data_pagamento')
+_CHAVES_NOME_LIVRO = ('NomeLivro', 'Nome')
+
+
+def _primeiro(dados: Dict[str, Any], chaves: Tuple[str, ...]) -> Any:
+    """Primeiro valor verdadeiro entre as chaves (mesma regra de ``a or b``)."""
+    valor = None
+    for chave in chaves:
+        valor = dados.get(chave)
+        if valor:
+            return valor
+    return valor
+
+
+def _centavos_diretos(valor_bruto: Any) -> Optional[int]:
+    """Centavos exatos de int, float inteiro ou texto "N.NN", sem Decimal(str())."""
+    if type(valor_bruto) is int:
+        return valor_bruto * 100
+    if type(valor_bruto) is float and valor_bruto.is_integer():
+        return int(valor_bruto) * 100
+    if type(valor_bruto) is str and _VALOR_DUAS_CASAS_RE.fullmatch(valor_bruto):
+        return int(valor_bruto.replace('.', ''))
+    return None
+
+
+def _em_centavos(valor: Decimal) -> int:
+    """Converter um valor monetário em centavos inteiros."""
+    return int((valor * 100).to_integral_value())
+
+
+def _de_centavos(centavos: int) -> Decimal:
+    """Converter centavos inteiros de volta em Decimal com duas casas."""
+    return Decimal(centavos).scaleb(-2)
+
+
+class _ResumoMultas:
+    """Acumula totais e contagens de multas enquanto elas são formatadas.
+
+    Os totais são somados em centavos (int) e só viram Decimal no final.
+    """
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.total_pendente = 0
+        self.total_pago = 0
+        self.total_vencido = 0
+        self.quantidade = 0
+        self.pendentes = 0
+        self.pagas = 0
+        self.vencidas = 0
+
+    def adicionar(self, centavos: int, status: Optional[str], em_atraso: bool) -> None:
+        self.quantidade += 1
+        self.total += centavos
+
+        if status == STATUS_PAGA:
+            self.total_pago += centavos
+            self.pagas += 1
+        elif em_atraso:
+            self.total_vencido += centavos
+            self.total_pendente += centavos
+            self.vencidas += 1
+        else:
+            self.total_pendente += centavos
+            self.pendentes += 1
+
+    def como_dict(self) -> Dict[str, Any]:
+        total = _de_centavos(self.total)
+        total_pendente = _de_centavos(self.total_pendente)
+        total_pago = _de_centavos(self.total_pago)
+        total_vencido = _de_centavos(self.total_vencido)
+        return {
+            'quantidade_total': self.quantidade,
+            'quantidade_pendentes': self.pendentes,
+            'quantidade_pagas': self.pagas,
+            'quantidade_vencidas': self.vencidas,
+            'total': total,
+            'total_formatado': formatar_valor_monetario(total),
+            'total_pendente': total_pendente,
+            'total_pendente_formatado': formatar_valor_monetario(total_pendente),
+            'total_pago': total_pago,
+            'total_pago_formatado': formatar_valor_monetario(total_pago),
+            'total_vencido': total_vencido,
+            'total_vencido_formatado': formatar_valor_monetario(total_vencido),
+        }
+
+
 class MultasController:
     """Encapsula regras de negócio para gerenciamento de multas."""
 
@@ -35,13 +156,14 @@ class MultasController:
         if not sucesso_multas:
             return False, {}, erro_multas or 'Não foi possível carregar as multas do cliente.'
 
-        multas_formatadas = self._formatar_multas(multas)
-        resumo = self.calcular_resumo(multas_formatadas)
+        # Resumo acumulado na mesma passada que formata as multas
+        resumo = _ResumoMultas()
+        multas_formatadas = self._formatar_multas(multas, resumo)
 
         payload = {
             'cliente': cliente,
             'multas': multas_formatadas,
-            'resumo': resumo,
+            'resumo': resumo.como_dict(),
         }
         return True, payload, ''
 
@@ -71,24 +193,20 @@ class MultasController:
 
     def obter_multa_por_id(self, multa_id: int) -> Tuple[bool, Dict[str, Any], str]:
         """Carrega uma multa específica pelo identificador."""
-        sucesso, multas, erro = self.listar_multas(multa_id=multa_id)
+        sucesso, multa, erro = self.api_client.obter_multa_por_id(multa_id)
         if not sucesso:
             return False, {}, erro
-        if not multas:
-            return False, {}, 'Multa não encontrada.'
-        return True, multas[0], ''
+        return True, self._formatar_multas([multa])[0], ''
 
     def registrar_multa(self, reserva_id: int, valor: str, data_vencimento: str) -> Tuple[bool, str]:
         """Registra uma multa manualmente aplicando validações básicas."""
         if not reserva_id or reserva_id <= 0:
             return False, 'Informe um ID de reserva válido.'
 
-        valor_decimal = interpretar_valor_monetario(valor)
-        if valor_decimal is None:
-            try:
-                valor_decimal = Decimal(str(valor).replace(',', '.'))
-            except (ValueError, ArithmeticError):
-                return False, 'Valor da multa inválido.'
+        try:
+            valor_decimal = interpretar_valor_monetario(valor)
+        except ValueError:
+            return False, 'Valor da multa inválido.'
 
         if valor_decimal <= 0:
             return False, 'Valor da multa deve ser maior que zero.'
@@ -98,7 +216,7 @@ class MultasController:
 
         sucesso, mensagem = self.api_client.criar_multa(
             reserva_id=int(reserva_id),
-            valor=float(valor_decimal),
+            valor=valor_decimal,
             data_vencimento=data_vencimento.strip(),
         )
         return sucesso, mensagem
@@ -112,94 +230,89 @@ class MultasController:
     @staticmethod
     def calcular_resumo(multas: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calcula totais financeiros e contagens auxiliares."""
-        total = Decimal('0')
-        total_pendente = Decimal('0')
-        total_pago = Decimal('0')
-        total_vencido = Decimal('0')
-        pendentes = 0
-        pagas = 0
-        vencidas = 0
-
+        resumo = _ResumoMultas()
         for multa in multas:
-            valor = multa.get('ValorDecimal', Decimal('0'))
-            total += valor
-
-            if multa.get('Status') == 'Paga':
-                total_pago += valor
-                pagas += 1
-            elif multa.get('EmAtraso'):
-                total_vencido += valor
-                total_pendente += valor
-                vencidas += 1
-            else:
-                total_pendente += valor
-                pendentes += 1
-
-        return {
-            'quantidade_total': len(multas),
-            'quantidade_pendentes': pendentes,
-            'quantidade_pagas': pagas,
-            'quantidade_vencidas': vencidas,
-            'total': total,
-            'total_formatado': formatar_valor_monetario(total),
-            'total_pendente': total_pendente,
-            'total_pendente_formatado': formatar_valor_monetario(total_pendente),
-            'total_pago': total_pago,
-            'total_pago_formatado': formatar_valor_monetario(total_pago),
-            'total_vencido': total_vencido,
-            'total_vencido_formatado': formatar_valor_monetario(total_vencido),
-        }
-
-    def _formatar_multas(self, multas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            centavos = multa.get('ValorCentavos')
+            if centavos is None:
+                centavos = _em_centavos(multa.get('ValorDecimal', _ZERO))
+            resumo.adicionar(centavos, multa.get('Status'), multa.get('EmAtraso'))
+        return resumo.como_dict()
+
+    def _formatar_multas(self,
+                         multas: List[Dict[str, Any]],
+                         resumo: Optional[_ResumoMultas] = None) -> List[Dict[str, Any]]:
         """Enriquece dados de multas com informações derivadas."""
-        hoje = datetime.now().date()
+        hoje_ordinal = datetime.now().toordinal()
         resultado: List[Dict[str, Any]] = []
 
         for multa in multas or []:
-            valor_bruto = multa.get('Valor', multa.get('valor', 0))
-            try:
-                valor_decimal = Decimal(str(valor_bruto)).quantize(Decimal('0.01'))
-            except (ValueError, ArithmeticError):
-                valor_decimal = Decimal('0')
+            # Métodos get ligados uma vez por linha (várias buscas por chave)
+            obter = multa.get
+            valor_bruto = obter('Valor', obter('valor', 0))
+            valor_centavos = _centavos_diretos(valor_bruto)
+            if valor_centavos is not None:
+                valor_decimal = _de_centavos(valor_centavos)
+            else:
+                # Demais casos (floats fracionários, textos livres): caminho exato
+                try:
+                    valor_decimal = Decimal(str(valor_bruto)).quantize(_CENTAVOS)
+                except (ValueError, ArithmeticError):
+                    valor_decimal = _ZERO
+                valor_centavos = _em_centavos(valor_decimal)
 
-            data_venc_str = multa.get('DataVencimento') or multa.get('data_vencimento')
-            data_pag_str = multa.get('DataPagamento') or multa.get('data_pagamento')
+            data_venc_str = _primeiro(multa, _CHAVES_VENCIMENTO)
+            data_pag_str = _primeiro(multa, _CHAVES_PAGAMENTO)
 
-            data_venc = interpretar_data(data_venc_str)
-            data_pag = interpretar_data(data_pag_str)
+            data_venc = _interpretar_data_memo(data_venc_str)
+            data_pag = _interpretar_data_memo(data_pag_str)
 
             em_atraso = False
             dias_atraso = 0
             if data_venc and not data_pag:
-                diff = (hoje - data_venc.date()).days
+                diff = hoje_ordinal - data_venc.toordinal()
                 if diff > 0:
                     em_atraso = True
                     dias_atraso = diff
 
-            status_original = multa.get('Status') or multa.get('status')
-            status = status_original or ('Paga' if data_pag else ('Vencida' if em_atraso else 'Pendente'))
+            status_calculado = STATUS_PAGA if data_pag else (STATUS_VENCIDA if em_atraso else STATUS_PENDENTE)
+            status = _primeiro(multa, _CHAVES_STATUS) or status_calculado
+            if type(status) is str:
+                status = sys.intern(status)
 
-            reserva = multa.get('reserva') or {}
-            cliente_info = reserva.get('cliente') or multa.get('cliente') or {}
-            livro_info = reserva.get('livro') or multa.get('livro') or {}
+            reserva = obter('reserva') or {}
+            obter_reserva = reserva.get
+            cliente_info = obter_reserva('cliente') or obter('cliente') or {}
+            livro_info = obter_reserva('livro') or obter('livro') or {}
+            obter_cliente = cliente_info.get
 
-            nome_cliente = ' '.join(filter(None, [cliente_info.get('Nome'), cliente_info.get('Sobrenome')])).strip()
+            nome = obter_cliente('Nome')
+            nome_cliente = ' '.join(filter(None, [nome, obter_cliente('Sobrenome')])).strip()
 
             resultado.append({
                 **multa,
-                'MultaID': multa.get('MultaID') or multa.get('multa_id'),
-                'ReservaID': multa.get('ReservaID') or multa.get('reserva_id') or reserva.get('ReservaID') or reserva.get('reserva_id'),
-                'ClienteID': multa.get('ClienteID') or multa.get('cliente_id') or reserva.get('ClienteID') or cliente_info.get('ClienteID'),
+                'MultaID': _primeiro(multa, _CHAVES_MULTA_ID),
+                'ReservaID': _primeiro(multa, _CHAVES_RESERVA_ID) or _primeiro(reserva, _CHAVES_RESERVA_ID),
+                'ClienteID': _primeiro(multa, _CHAVES_CLIENTE_ID) or obter_reserva('ClienteID') or obter_cliente('ClienteID'),
                 'ValorDecimal': valor_decimal,
+                'ValorCentavos': valor_centavos,
                 'ValorFormatado': formatar_valor_monetario(valor_decimal),
-                'DataVencimentoFormatada': formatar_data_para_exibicao(data_venc_str),
-                'DataPagamentoFormatada': formatar_data_para_exibicao(data_pag_str) if data_pag_str else 'N/D',
+                'DataVencimentoFormatada': self._exibir_data(data_venc, data_venc_str),
+                'DataPagamentoFormatada': self._exibir_data(data_pag, data_pag_str) if data_pag_str else 'N/D',
                 'Status': status,
-                'StatusCalculado': 'Paga' if data_pag else ('Vencida' if em_atraso else 'Pendente'),
+                'StatusCalculado': status_calculado,
                 'EmAtraso': em_atraso,
                 'DiasEmAtraso': dias_atraso,
-                'ClienteNome': nome_cliente or cliente_info.get('Nome') or '',
-                'LivroNome': livro_info.get('NomeLivro') or livro_info.get('Nome') or reserva.get('LivroNome') or livro_info.get('nome'),
+                'ClienteNome': nome_cliente or nome or '',
+                'LivroNome': _primeiro(livro_info, _CHAVES_NOME_LIVRO) or obter_reserva('LivroNome') or livro_info.get('nome'),
             })
+            if resumo is not None:
+                resumo.adicionar(valor_centavos, status, em_atraso)
 
         return resultado
+
+    @staticmethod
+    def _exibir_data(data: Optional[datetime], data_str: Any) -> str:
+        """Formatar para exibição a data já interpretada (sem novo strptime)."""
+        if not data:
+            return data_str or ''
+        return data.strftime(DISPLAY_DATA_FORMAT)
@@ -1,27 +1,208 @@
 """
 Cliente HTTP para comunicação com a API
 """
+import atexit
+import json as _json
 import logging
-from datetime import datetime
-import requests
-from typing import Dict, Any, Optional
-from requests.exceptions import (
-    RequestException,
-    Timeout,
-    ConnectionError,
-    HTTPError,
-)
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Any, Optional, Union
 from src.config.settings import (
     API_BASE_URL,
     API_TIMEOUT,
     API_AUTH_EMAIL,
     API_AUTH_PASSWORD,
+    API_COOKIES_FILE,
 )
 from src.utils.formatters import normalizar_data_para_api
 
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    _codificar_json = orjson.dumps
+    _decodificar_json = orjson.loads
+except ImportError:  # orjson é opcional
+    def _codificar_json(dados: Any) -> bytes:
+        return _json.dumps(dados, ensure_ascii=False, allow_nan=False).encode('utf-8')
+
+    # json.loads aceita bytes (detecta UTF-8/16/32); erros são ValueError nos dois casos
+    _decodificar_json = _json.loads
+
+# Pool de conexões keep-alive por host e retentativas automáticas só para GET/HEAD.
+# O transporte segue em HTTP/1.1 (requests): a API Express escuta em HTTP puro,
+# sem TLS/ALPN nem h2c, então um cliente HTTP/2 (httpx http2=True) negociaria
+# HTTP/1.1 do mesmo jeito; a paralelização vem do pool + MAX_REQUISICOES_PARALELAS
+TAMANHO_POOL_CONEXOES = 16
+
+# Cache curto de GETs idempotentes (busca por CPF/ID, gêneros) repetidos pela GUI
+CACHE_GET_TTL_S = 30
+CACHE_GET_MAX_ITENS = 512
+
+# Chamadas simultâneas no executor compartilhado (telas em segundo plano); acima
+# de ~4 a disputa no servidor (pool de conexões do banco) piora o tempo total
+MAX_REQUISICOES_PARALELAS = 4
+
+# Chaves onde a API (e o Express) colocam a mensagem de erro, em ordem de preferência
+_CHAVES_ERRO = ('message', 'mensagem', 'error', 'detail', 'errors')
+
+# Tabelas de normalização dos cadastros (montadas uma vez)
+_SEPARADORES_CPF = str.maketrans('', '', '.- ')
+_CAMPOS_STR_CLIENTE = ('CEP', 'Rua', 'Numero', 'Bairro', 'Cidade', 'Estado')
+_CAMPOS_OBRIGATORIOS_CLIENTE = (
+    'Nome', 'Sobrenome', 'CPF', 'DataNascimento', 'DataAfiliacao',
+    'CEP', 'Rua', 'Numero', 'Bairro', 'Cidade', 'Estado',
+)
+_CAMPOS_STR_LIVRO = ('NomeLivro', 'Autor', 'Editora', 'Idioma', 'NomeGenero')
+_CAMPOS_OBRIGATORIOS_LIVRO = (
+    'NomeLivro', 'Autor', 'Editora', 'DataPublicacao', 'Idioma',
+    'QuantidadePaginas', 'NomeGenero', 'QuantidadeDisponivel',
+)
+
+
+def _campo_ausente(dados: Dict[str, Any], campos: tuple) -> Optional[str]:
+    """Retorna o primeiro campo obrigatório vazio (None ou só espaços), se houver."""
+    for campo in campos:
+        valor = dados.get(campo)
+        if valor is None or (isinstance(valor, str) and not valor.strip()):
+            return campo
+    return None
+
+
+# requests/urllib3 (e as exceções usadas nos except) só são importados na criação
+# da primeira sessão; até lá a GUI abre sem pagar esse custo
+requests: Any = None
+_AdaptadorHTTP: Any = None
+_importacao_lock = threading.Lock()
+
+
+def _importar_http() -> None:
+    """Importar requests e definir o adaptador HTTP na primeira chamada."""
+    global requests, _AdaptadorHTTP
+    with _importacao_lock:
+        if _AdaptadorHTTP is not None:
+            return
+        import requests as _requests
+        from requests.adapters import HTTPAdapter
+
+        class AdaptadorHTTP(HTTPAdapter):
+            """HTTPAdapter que aplica o timeout padrão do cliente quando a chamada não define um."""
+
+            def __init__(self, timeout: float, **kwargs):
+                self._timeout = timeout
+                super().__init__(**kwargs)
+
+            def send(self, request, timeout=None, **kwargs):
+                return super().send(request, timeout=self._timeout if timeout is None else timeout, **kwargs)
+
+        requests = _requests
+        _AdaptadorHTTP = AdaptadorHTTP
+
+
+def _criar_sessao(timeout: float) -> 'requests.Session':
+    """Cria a sessão HTTP com pool keep-alive e retentativas de GET/HEAD."""
+    _importar_http()
+    from urllib3.util import make_headers
+    from urllib3.util.retry import Retry
+
+    sessao = requests.Session()
+    adaptador = _AdaptadorHTTP(
+        timeout,
+        pool_connections=TAMANHO_POOL_CONEXOES,
+        pool_maxsize=TAMANHO_POOL_CONEXOES,
+        max_retries=Retry(
+            total=3,
+            # Falha de conexão vale para qualquer método: com a API fora do ar,
+            # uma só retentativa evita travar a tela por vários timeouts seguidos
+            connect=1,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False,
+        ),
+    )
+    sessao.mount('http://', adaptador)
+    sessao.mount('https://', adaptador)
+    sessao.headers.update({
+        'Content-Type': 'application/json',
+        # gzip/deflate sempre; br (e zstd) só quando o decodificador está instalado
+        'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
+    })
+    return sessao
+
+
+def _carregar_cookies(sessao: Any, arquivo: str) -> None:
+    """Restaura na sessão os cookies ainda válidos salvos na execução anterior."""
+    try:
+        with open(arquivo, 'rb') as origem:
+            cookies = _decodificar_json(origem.read())
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as exc:
+        logger.warning('Cookies da API não carregados (%s): %s', arquivo, exc)
+        return
+
+    agora = time.time()
+    for cookie in cookies if isinstance(cookies, list) else []:
+        try:
+            expira = cookie.get('expires')
+            if expira is not None and expira <= agora:
+                continue
+            sessao.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/'),
+                expires=expira, secure=bool(cookie.get('secure')),
+            )
+        except (AttributeError, KeyError, TypeError):
+            continue
+
+
+def _salvar_cookies(sessao: Any, arquivo: str) -> None:
+    """Grava os cookies da sessão em JSON (escrita atômica: várias instâncias podem fechar juntas)."""
+    agora = time.time()
+    cookies = [
+        {'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path,
+         'expires': c.expires, 'secure': c.secure}
+        for c in sessao.cookies
+        if c.expires is None or c.expires > agora
+    ]
+    if not cookies and not os.path.exists(arquivo):
+        return
+    temporario = f'{arquivo}.{os.getpid()}.tmp'
+    try:
+        with open(temporario, 'wb') as destino:
+            destino.write(_codificar_json(cookies))
+        os.replace(temporario, arquivo)
+    except OSError as exc:
+        logger.warning('Cookies da API não salvos (%s): %s', arquivo, exc)
+
+
+def _chave_get(endpoint: str, params: Optional[Dict]) -> Optional[tuple]:
+    """Chave hashable de um GET (listas viram tuplas); None se algum valor não for hashable."""
+    if not params:
+        return (endpoint, ())
+    itens = []
+    for nome, valor in params.items():
+        if isinstance(valor, (list, tuple)):
+            valor = tuple(valor)
+        itens.append((str(nome), valor))
+    chave = (endpoint, tuple(sorted(itens, key=lambda item: item[0])))
+    try:
+        hash(chave)
+    except TypeError:
+        return None
+    return chave
+
+
+# Corpo JSON: dicionário a serializar ou bytes já serializados pelo chamador
+CorpoJSON = Optional[Union[Dict, bytes]]
+
 
 class APIClient:
     """Cliente para fazer requisições HTTP para a API"""
@@ -32,6 +213,7 @@ class APIClient:
         timeout: int = API_TIMEOUT,
         email: str = API_AUTH_EMAIL,
         senha: str = API_AUTH_PASSWORD,
+        arquivo_cookies: str = API_COOKIES_FILE,
     ):
         """
         Inicializa o cliente da API
@@ -39,18 +221,63 @@ class APIClient:
         Args:
             base_url: URL base da API
             timeout: Tempo máximo de espera em segundos
+            arquivo_cookies: JSON onde os cookies persistem entre execuções ('' desativa)
         """
         self.base_url = base_url
         self.timeout = timeout
-        self.session = requests.Session()
+        self._arquivo_cookies = arquivo_cookies
+        # Sessão HTTP e executor criados no primeiro acesso (e recriados após fechar)
+        self._sessao: Optional['requests.Session'] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._sessao_lock = threading.Lock()
+        self._fechamento_registrado = False
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._email = email
         self._senha = senha
+        # (endpoint, params ordenados) -> (expira_em, dados); ordem = LRU
+        self._cache_get: OrderedDict = OrderedDict()
+        self._cache_get_lock = threading.Lock()
+        # GETs em andamento: chamadas idênticas simultâneas aguardam a primeira
+        self._em_voo: Dict[tuple, Future] = {}
+        self._em_voo_lock = threading.Lock()
 
         if self._email and self._senha:
             logger.info('Autenticação desativada: a API agora opera sem tokens.')
-        self.session.headers.update({'Content-Type': 'application/json'})
+
+    @property
+    def session(self) -> 'requests.Session':
+        """Sessão HTTP compartilhada, criada (e requests importado) no primeiro uso."""
+        sessao = self._sessao
+        if sessao is None:
+            with self._sessao_lock:
+                if self._sessao is None:
+                    sessao = _criar_sessao(self.timeout)
+                    if self._arquivo_cookies:
+                        _carregar_cookies(sessao, self._arquivo_cookies)
+                    self._sessao = sessao
+                    self._registrar_fechamento()
+                sessao = self._sessao
+        return sessao
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Executor compartilhado das chamadas em segundo plano, criado no primeiro uso."""
+        executor = self._executor
+        if executor is None:
+            with self._sessao_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=MAX_REQUISICOES_PARALELAS,
+                                                        thread_name_prefix='api')
+                    self._registrar_fechamento()
+                executor = self._executor
+        return executor
+
+    def _registrar_fechamento(self) -> None:
+        """Agenda fechar() para o fim do processo (uma vez por cliente)."""
+        if not self._fechamento_registrado:
+            atexit.register(self.fechar)
+            self._fechamento_registrado = True
 
     def _definir_token(self, token: Optional[str]) -> None:
         """Atualiza o header Authorization conforme o token atual."""
@@ -81,7 +308,7 @@ class APIClient:
 
         try:
             response = self.session.post(url, json=payload, timeout=self.timeout)
-        except (Timeout, ConnectionError, RequestException) as exc:
+        except requests.exceptions.RequestException as exc:
             logger.error('Erro ao autenticar na API: %s', exc)
             if auth_backup:
                 self.session.headers['Authorization'] = auth_backup
@@ -97,7 +324,7 @@ class APIClient:
             return False
 
         try:
-            dados = response.json()
+            dados = _decodificar_json(response.content)
         except ValueError:
             logger.error('Resposta inválida ao autenticar: JSON ausente.')
             if auth_backup:
@@ -134,7 +361,7 @@ class APIClient:
 
         try:
             response = self.session.post(url, json=payload, timeout=self.timeout)
-        except (Timeout, ConnectionError, RequestException) as exc:
+        except requests.exceptions.RequestException as exc:
             logger.error('Erro ao renovar token: %s', exc)
             return False
 
@@ -144,7 +371,7 @@ class APIClient:
             return False
 
         try:
-            dados = response.json()
+            dados = _decodificar_json(response.content)
         except ValueError:
             logger.error('Resposta inválida ao renovar token: JSON ausente.')
             return False
@@ -175,7 +402,7 @@ class APIClient:
 
         try:
             response = self.session.post(url, json=payload, timeout=self.timeout)
-        except (Timeout, ConnectionError, RequestException) as exc:
+        except requests.exceptions.RequestException as exc:
             logger.error('Erro ao tentar registro automático: %s', exc)
             return False
 
@@ -204,29 +431,48 @@ class APIClient:
         return self._executar_login()
 
     @staticmethod
-    def _extrair_mensagem_erro(response: requests.Response) -> str:
+    def _extrair_mensagem_erro(response: 'requests.Response') -> str:
         """Extrai mensagem amigável de um response HTTP."""
         try:
-            payload = response.json()
+            payload = _decodificar_json(response.content)
         except ValueError:
-            texto = response.text.strip()
+            # A API responde em UTF-8: evita a detecção de charset de response.text
+            texto = response.content.decode('utf-8', 'replace').strip()
             return texto or f'HTTP {response.status_code}'
+        return APIClient._mensagem_do_payload(payload, response.status_code)
 
-        for chave in ('message', 'mensagem', 'error', 'detail', 'errors'):
+    @staticmethod
+    def _mensagem_do_payload(payload: Any, status_code: int) -> str:
+        """Extrai a mensagem de erro de um corpo JSON já decodificado."""
+        # Valores vindos do decodificador JSON têm tipos exatos: "type(x) is" basta
+        if type(payload) is not dict:
+            return f'HTTP {status_code}'
+
+        for chave in _CHAVES_ERRO:
             valor = payload.get(chave)
-            if isinstance(valor, str) and valor.strip():
-                return valor.strip()
-            if isinstance(valor, dict):
-                return next((str(v) for v in valor.values() if v), f'HTTP {response.status_code}')
-            if isinstance(valor, list):
+            if not valor:
+                continue
+            tipo = type(valor)
+            if tipo is str:
+                texto = valor.strip()
+                if texto:
+                    return texto
+            elif tipo is dict:
+                for item in valor.values():
+                    if item:
+                        return str(item)
+            elif tipo is list:
                 for item in valor:
-                    if isinstance(item, str) and item.strip():
-                        return item.strip()
-                    if isinstance(item, dict):
-                        mensagem = next((str(v) for v in item.values() if v), None)
-                        if mensagem:
-                            return mensagem
-        return f'HTTP {response.status_code}'
+                    tipo_item = type(item)
+                    if tipo_item is str:
+                        texto = item.strip()
+                        if texto:
+                            return texto
+                    elif tipo_item is dict:
+                        for campo in item.values():
+                            if campo:
+                                return str(campo)
+        return f'HTTP {status_code}'
     
     def _fazer_requisicao(self, metodo: str, endpoint: str, 
                          **kwargs) -> tuple[bool, Dict[str, Any], str]:
@@ -241,53 +487,139 @@ class APIClient:
         Returns:
             tuple: (sucesso, dados, mensagem_erro)
         """
-        url = f"{self.base_url}{endpoint}"
-        kwargs['timeout'] = self.timeout
-        tentativas = 0
+        # O timeout padrão é aplicado pelo _AdaptadorHTTP montado na sessão
+        url = self.base_url + endpoint
 
-        while tentativas < 2:
-            tentativas += 1
-
-            try:
-                response = self.session.request(metodo, url, **kwargs)
-            except Timeout:
-                return False, {}, 'Timeout: A API levou muito tempo para responder'
-            except ConnectionError:
-                return False, {}, 'Erro de conexão: Não foi possível conectar à API'
-            except RequestException as exc:
-                return False, {}, f'Erro na requisição: {str(exc)}'
-
-            if response.status_code == 401:
-                mensagem = self._extrair_mensagem_erro(response)
-                return False, {}, f'Não autorizado: {mensagem}'
+        # Retentativas de falhas transitórias ficam no Retry do adaptador (leitura/status só
+        # em GET/HEAD; falha de conexão uma vez para qualquer método).
+        # O Content-Type application/json já vem da sessão
+        corpo = kwargs.pop('json', None)
+        if corpo is not None:
+            kwargs['data'] = corpo if isinstance(corpo, (bytes, bytearray)) else _codificar_json(corpo)
 
-            try:
-                response.raise_for_status()
-            except HTTPError as exc:
-                mensagem = self._extrair_mensagem_erro(response)
-                logger.warning('Falha na requisição %s %s: %s', metodo.upper(), endpoint, mensagem)
-                return False, {}, mensagem or str(exc)
+        try:
+            response = self.session.request(metodo, url, **kwargs)
+        except requests.exceptions.Timeout:
+            return False, {}, 'Timeout: A API levou muito tempo para responder'
+        except requests.exceptions.ConnectionError:
+            return False, {}, 'Erro de conexão: Não foi possível conectar à API'
+        except requests.exceptions.RequestException as exc:
+            return False, {}, f'Erro na requisição: {str(exc)}'
+        finally:
+            # Qualquer escrita (mesmo com timeout) pode ter mudado livros, estoque,
+            # clientes ou gêneros: descarta todos os GETs em cache
+            if metodo.upper() != 'GET':
+                self._limpar_cache_get()
+
+        if response.status_code == 401:
+            mensagem = self._extrair_mensagem_erro(response)
+            return False, {}, f'Não autorizado: {mensagem}'
 
-            try:
-                return True, response.json(), ''
-            except ValueError:
-                return True, {}, ''
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as exc:
+            mensagem = self._extrair_mensagem_erro(response)
+            logger.warning('Falha na requisição %s %s: %s', metodo.upper(), endpoint, mensagem)
+            return False, {}, mensagem or str(exc)
 
-        return False, {}, 'Não foi possível completar a requisição após reautenticar'
+        try:
+            return True, _decodificar_json(response.content), ''
+        except ValueError:
+            return True, {}, ''
     
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> tuple[bool, Dict, str]:
-        """Faz uma requisição GET"""
-        return self._fazer_requisicao('GET', endpoint, params=params)
+    def get(self, endpoint: str, params: Optional[Dict] = None,
+            cache: bool = False, forma: Optional[str] = None) -> tuple[bool, Any, str]:
+        """
+        Faz uma requisição GET
+        
+        Com cache=True, respostas de sucesso são reaproveitadas por CACHE_GET_TTL_S
+        segundos e chamadas idênticas simultâneas compartilham uma só requisição;
+        use só onde os dados retornados não são alterados pelo chamador.
+        Com forma='lista' ou 'objeto', devolve já o conteúdo de 'data' normalizado
+        (lista, mesmo com item único/vazio; ou dicionário).
+        """
+        chave = _chave_get(endpoint, params) if cache else None
+        if chave is None:
+            sucesso, dados, erro = self._fazer_requisicao('GET', endpoint, params=params)
+        else:
+            sucesso, dados, erro = self._get_coalescido(chave, endpoint, params)
+
+        if forma is None:
+            return sucesso, dados, erro
+        if forma == 'lista':
+            if not sucesso:
+                return False, [], erro
+            resultado = dados.get('data', [])
+            if isinstance(resultado, list):
+                return True, resultado, ''
+            return True, [resultado] if resultado else [], ''
+        if not sucesso:
+            return False, {}, erro
+        return True, dados.get('data', {}), ''
+
+    def _get_coalescido(self, chave: tuple, endpoint: str,
+                        params: Optional[Dict]) -> tuple[bool, Dict, str]:
+        """
+        Executa o GET em cache ou, se um idêntico já está em andamento, aguarda o dele
+        
+        Só para GETs com cache=True: o resultado é compartilhado entre os chamadores,
+        como já acontece com as respostas em cache. A primeira chamada roda na
+        própria thread (não no executor, que pode estar ocupado esperando por ela).
+        """
+        with self._em_voo_lock:
+            futuro = self._em_voo.get(chave)
+            lider = futuro is None
+            if lider:
+                futuro = self._em_voo[chave] = Future()
+        if not lider:
+            return futuro.result()
+
+        try:
+            resultado = self._get_em_cache(chave, endpoint, params)
+        except BaseException as exc:
+            futuro.set_exception(exc)
+            raise
+        else:
+            futuro.set_result(resultado)
+        finally:
+            with self._em_voo_lock:
+                self._em_voo.pop(chave, None)
+        return resultado
+
+    def _get_em_cache(self, chave: tuple, endpoint: str, params: Optional[Dict]) -> tuple[bool, Dict, str]:
+        """GET com o cache curto de respostas (ver CACHE_GET_TTL_S)."""
+        agora = time.monotonic()
+        with self._cache_get_lock:
+            item = self._cache_get.get(chave)
+            if item is not None:
+                if item[0] > agora:
+                    self._cache_get.move_to_end(chave)
+                    return True, item[1], ''
+                del self._cache_get[chave]
+
+        sucesso, dados, erro = self._fazer_requisicao('GET', endpoint, params=params)
+        if sucesso:
+            with self._cache_get_lock:
+                self._cache_get[chave] = (agora + CACHE_GET_TTL_S, dados)
+                self._cache_get.move_to_end(chave)
+                while len(self._cache_get) > CACHE_GET_MAX_ITENS:
+                    self._cache_get.popitem(last=False)
+        return sucesso, dados, erro
+
+    def _limpar_cache_get(self) -> None:
+        """Descarta todas as respostas GET em cache."""
+        with self._cache_get_lock:
+            self._cache_get.clear()
     
-    def post(self, endpoint: str, json: Optional[Dict] = None) -> tuple[bool, Dict, str]:
+    def post(self, endpoint: str, json: CorpoJSON = None) -> tuple[bool, Dict, str]:
         """Faz uma requisição POST"""
         return self._fazer_requisicao('POST', endpoint, json=json)
     
-    def put(self, endpoint: str, json: Optional[Dict] = None) -> tuple[bool, Dict, str]:
+    def put(self, endpoint: str, json: CorpoJSON = None) -> tuple[bool, Dict, str]:
         """Faz uma requisição PUT"""
         return self._fazer_requisicao('PUT', endpoint, json=json)
     
-    def patch(self, endpoint: str, json: Optional[Dict] = None) -> tuple[bool, Dict, str]:
+    def patch(self, endpoint: str, json: CorpoJSON = None) -> tuple[bool, Dict, str]:
         """Faz uma requisição PATCH"""
         return self._fazer_requisicao('PATCH', endpoint, json=json)
     
@@ -296,9 +628,17 @@ class APIClient:
         return self._fazer_requisicao('DELETE', endpoint)
     
     def fechar(self):
-        """Fecha a sessão HTTP"""
-        self.session.close()
-    
+        """Fecha a sessão HTTP e o executor; um novo uso recria os dois"""
+        with self._sessao_lock:
+            executor, self._executor = self._executor, None
+            sessao, self._sessao = self._sessao, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if sessao is not None:
+            if self._arquivo_cookies:
+                _salvar_cookies(sessao, self._arquivo_cookies)
+            sessao.close()
+
     def _processar_resposta_lista(self, sucesso: bool, dados: Dict, erro: str, chave_dados: str = 'data') -> tuple[bool, list, str]:
         """
         Helper para processar respostas que retornam listas.
@@ -318,23 +658,6 @@ class APIClient:
             return True, lista, ''
         return False, [], erro
     
-    def _processar_resposta_objeto(self, sucesso: bool, dados: Dict, erro: str, chave_dados: str = 'data') -> tuple[bool, Dict, str]:
-        """
-        Helper para processar respostas que retornam objetos.
-        
-        Args:
-            sucesso: Se a requisição foi bem-sucedida
-            dados: Dados retornados
-            erro: Mensagem de erro
-            chave_dados: Chave onde estão os dados (default: 'data')
-            
-        Returns:
-            tuple: (sucesso, dados_objeto, mensagem_erro)
-        """
-        if sucesso:
-            return True, dados.get(chave_dados, {}), ''
-        return False, {}, erro
-    
     # ==================== Métodos de Consulta de Clientes ====================
     
     def buscar_cliente_por_nome(self, nome: str) -> tuple[bool, list, str]:
@@ -350,8 +673,7 @@ class APIClient:
         if not nome or not nome.strip():
             return False, [], 'Nome não pode ser vazio'
         
-        sucesso, dados, erro = self.get('/cliente', params={'Nome': nome.strip()})
-        return self._processar_resposta_lista(sucesso, dados, erro)
+        return self.get('/cliente', params={'Nome': nome.strip()}, forma='lista')
     
     def buscar_cliente_por_cpf(self, cpf: str) -> tuple[bool, Dict, str]:
         """
@@ -367,13 +689,12 @@ class APIClient:
             return False, {}, 'CPF não pode ser vazio'
         
         # Remover formatação do CPF
-        cpf_limpo = cpf.strip().replace(".", "").replace("-", "").replace(" ", "")
+        cpf_limpo = cpf.translate(_SEPARADORES_CPF).strip()
         
         if len(cpf_limpo) != 11 or not cpf_limpo.isdigit():
             return False, {}, 'CPF inválido'
         
-        sucesso, dados, erro = self.get(f'/cliente/cpf/{cpf_limpo}')
-        return self._processar_resposta_objeto(sucesso, dados, erro)
+        return self.get(f'/cliente/cpf/{cpf_limpo}', cache=True, forma='objeto')
     
     def buscar_clientes_por_estado(self, estado: str) -> tuple[bool, list, str]:
         """
@@ -388,8 +709,7 @@ class APIClient:
         if not estado or not estado.strip():
             return False, [], 'Estado não pode ser vazio'
         
-        sucesso, dados, erro = self.get('/endereco', params={'Estado': estado.strip().upper()})
-        return self._processar_resposta_lista(sucesso, dados, erro)
+        return self.get('/endereco', params={'Estado': estado.strip().upper()}, forma='lista')
     
     # ==================== Métodos de Consulta de Livros ====================
     
@@ -406,8 +726,7 @@ class APIClient:
         if not nome or not nome.strip():
             return False, [], 'Nome do livro não pode ser vazio'
         
-        sucesso, dados, erro = self.get('/livro', params={'NomeLivro': nome.strip()})
-        return self._processar_resposta_lista(sucesso, dados, erro)
+        return self.get('/livro', params={'NomeLivro': nome.strip()}, forma='lista')
     
     def buscar_livros_por_autor(self, autor: str) -> tuple[bool, list, str]:
         """
@@ -422,8 +741,7 @@ class APIClient:
         if not autor or not autor.strip():
             return False, [], 'Nome do autor não pode ser vazio'
         
-        sucesso, dados, erro = self.get('/livro/autor', params={'NomeAutor': autor.strip()})
-        return self._processar_resposta_lista(sucesso, dados, erro)
+        return self.get('/livro/autor', params={'NomeAutor': autor.strip()}, forma='lista')
     
     def buscar_livros_por_genero(self, genero: str) -> tuple[bool, list, str]:
         """
@@ -438,8 +756,7 @@ class APIClient:
         if not genero or not genero.strip():
             return False, [], 'Gênero não pode ser vazio'
         
-        sucesso, dados, erro = self.get('/genero', params={'NomeGenero': genero.strip()})
-        return self._processar_resposta_lista(sucesso, dados, erro)
+        return self.get('/genero', params={'NomeGenero': genero.strip()}, cache=True, forma='lista')
 
     def listar_generos(self) -> tuple[bool, list, str]:
         """Lista os gêneros existentes no banco.
@@ -449,7 +766,7 @@ class APIClient:
         Returns:
             tuple: (sucesso, lista_generos, mensagem_erro)
         """
-        sucesso, dados, erro = self.get('/genero')
+        sucesso, dados, erro = self.get('/genero', cache=True)
         if sucesso:
             resultado = dados.get('data', dados.get('dados', []))
             if resultado is None:
@@ -472,9 +789,8 @@ class APIClient:
         if not livro_id or not str(livro_id).strip():
             return False, {}, 'ID do livro não pode ser vazio'
         
-        sucesso, dados, erro = self.get(f'/livro/{livro_id}')
-        return self._processar_resposta_objeto(sucesso, dados, erro)
-    
+        return self.get(f'/livro/{livro_id}', cache=True, forma='objeto')
+
     # ==================== Métodos de Cadastro ====================
     
     def cadastrar_cliente(self, dados_cliente: Dict[str, Any]) -> tuple[bool, str]:
@@ -501,32 +817,18 @@ class APIClient:
                 payload.setdefault(chave, valor)
 
         # Normalizações e tipos: a API valida strings (usa .trim() no Node).
-        if 'CPF' in payload and payload['CPF'] is not None:
-            cpf_str = str(payload['CPF']).strip()
-            payload['CPF'] = cpf_str.replace('.', '').replace('-', '')
-
-        for campo in ('CEP', 'Rua', 'Numero', 'Bairro', 'Cidade', 'Estado'):
-            if campo in payload and payload[campo] is not None:
-                payload[campo] = str(payload[campo]).strip()
-
-        campos_obrigatorios = [
-            'Nome',
-            'Sobrenome',
-            'CPF',
-            'DataNascimento',
-            'DataAfiliacao',
-            'CEP',
-            'Rua',
-            'Numero',
-            'Bairro',
-            'Cidade',
-            'Estado',
-        ]
-
-        for campo in campos_obrigatorios:
+        cpf = payload.get('CPF')
+        if cpf is not None:
+            payload['CPF'] = str(cpf).translate(_SEPARADORES_CPF).strip()
+
+        for campo in _CAMPOS_STR_CLIENTE:
             valor = payload.get(campo)
-            if valor is None or (isinstance(valor, str) and not valor.strip()):
-                return False, f'Campo obrigatório ausente: {campo}'
+            if valor is not None:
+                payload[campo] = str(valor).strip()
+
+        ausente = _campo_ausente(payload, _CAMPOS_OBRIGATORIOS_CLIENTE)
+        if ausente:
+            return False, f'Campo obrigatório ausente: {ausente}'
 
         sucesso, dados, erro = self.post('/cliente', json=payload)
         
@@ -548,25 +850,15 @@ class APIClient:
             return False, 'Dados do livro não podem ser vazios'
         
         # Validações básicas (alinhadas com a GUI e a API)
-        campos_obrigatorios = [
-            'NomeLivro',
-            'Autor',
-            'Editora',
-            'DataPublicacao',
-            'Idioma',
-            'QuantidadePaginas',
-            'NomeGenero',
-            'QuantidadeDisponivel',
-        ]
-        for campo in campos_obrigatorios:
-            valor = dados_livro.get(campo)
-            if valor is None or (isinstance(valor, str) and not valor.strip()):
-                return False, f'Campo obrigatório ausente: {campo}'
+        ausente = _campo_ausente(dados_livro, _CAMPOS_OBRIGATORIOS_LIVRO)
+        if ausente:
+            return False, f'Campo obrigatório ausente: {ausente}'
 
         # Normalizações leves
-        for campo_str in ('NomeLivro', 'Autor', 'Editora', 'Idioma', 'NomeGenero'):
-            if campo_str in dados_livro and dados_livro[campo_str] is not None:
-                dados_livro[campo_str] = str(dados_livro[campo_str]).strip()
+        for campo_str in _CAMPOS_STR_LIVRO:
+            valor = dados_livro.get(campo_str)
+            if valor is not None:
+                dados_livro[campo_str] = str(valor).strip()
 
         try:
             dados_livro['QuantidadePaginas'] = int(dados_livro['QuantidadePaginas'])
@@ -628,8 +920,7 @@ class APIClient:
         Returns:
             tuple: (sucesso, lista_reservas, mensagem_erro)
         """
-        sucesso, dados, erro = self.get('/reservas', params={'status': 'ativa'})
-        return self._processar_resposta_lista(sucesso, dados, erro)
+        return self.get('/reservas', params={'status': 'ativa'}, forma='lista')
     
     def registrar_devolucao(self, reserva_id: int, data_devolucao: str) -> tuple[bool, str]:
         """
@@ -673,8 +964,7 @@ class APIClient:
         if filtro_status and filtro_status != 'todas':
             params['status'] = filtro_status
         
-        sucesso, dados, erro = self.get('/reservas', params=params)
-        return self._processar_resposta_lista(sucesso, dados, erro)
+        return self.get('/reservas', params=params, forma='lista')
     
     def obter_reserva_por_id(self, reserva_id: int) -> tuple[bool, Dict, str]:
         """
@@ -689,9 +979,8 @@ class APIClient:
         if not reserva_id or reserva_id <= 0:
             return False, {}, 'ID da reserva inválido'
         
-        sucesso, dados, erro = self.get(f'/reservas/{reserva_id}')
-        return self._processar_resposta_objeto(sucesso, dados, erro)
-    
+        return self.get(f'/reservas/{reserva_id}', forma='objeto')
+
     def atualizar_reserva(self, reserva_id: int, dados_atualizacao: Dict[str, Any]) -> tuple[bool, str]:
         """
         Atualiza todos os dados de uma reserva.
@@ -838,6 +1127,27 @@ class APIClient:
 
         return False, [], erro
 
+    def obter_multa_por_id(self, multa_id: int) -> tuple[bool, Dict, str]:
+        """
+        Obtém uma multa específica.
+        
+        Args:
+            multa_id: ID da multa
+            
+        Returns:
+            tuple: (sucesso, dados_multa, mensagem_erro)
+        """
+        if not multa_id or multa_id <= 0:
+            return False, {}, 'ID da multa inválido'
+        
+        # A API não tem rota por ID de multa; o filtro multaId devolve no máximo uma
+        sucesso, multas, erro = self.get('/multas', params={'multaId': str(int(multa_id))}, forma='lista')
+        if not sucesso:
+            return False, {}, erro
+        if not multas:
+            return False, {}, 'Multa não encontrada.'
+        return True, multas[0], ''
+    
     def listar_multas_por_cliente(self, cliente_id: int) -> tuple[bool, list, str]:
         """Lista multas de um cliente específico."""
         return self.listar_multas(cliente_id=cliente_id)
@@ -846,17 +1156,21 @@ class APIClient:
         """Lista todas as multas pendentes."""
         return self.listar_multas(status='pendente')
 
-    def criar_multa(self, reserva_id: int, valor: float, data_vencimento: str) -> tuple[bool, str]:
+    def criar_multa(self, reserva_id: int, valor: Union[Decimal, float, str],
+                    data_vencimento: str) -> tuple[bool, str]:
         """Registra manualmente uma multa vinculada a uma reserva."""
         if not reserva_id or reserva_id <= 0:
             return False, 'ID da reserva inválido'
 
         try:
-            valor_float = float(valor)
-        except (TypeError, ValueError):
+            quantia = valor if isinstance(valor, Decimal) else Decimal(str(valor))
+        except (InvalidOperation, ValueError):
+            return False, 'Valor inválido'
+
+        if not quantia.is_finite():
             return False, 'Valor inválido'
 
-        if valor_float <= 0:
+        if quantia <= 0:
             return False, 'Valor deve ser maior que zero'
 
         if not data_vencimento or not data_vencimento.strip():
@@ -864,7 +1178,8 @@ class APIClient:
 
         payload = {
             'ReservaID': int(reserva_id),
-            'Valor': valor_float,
+            # Texto decimal exato (a API aceita string numérica): sem arredondar via float
+            'Valor': format(quantia, 'f'),
             'DataVencimento': normalizar_data_para_api(data_vencimento.strip()),
         }
 
@@ -881,7 +1196,7 @@ class APIClient:
             return False, 'ID da multa inválido'
 
         data_pagamento_norm = normalizar_data_para_api(
-            (data_pagamento or datetime.now().strftime('%d/%m/%Y')).strip()
+            (data_pagamento or time.strftime('%d/%m/%Y')).strip()
         )
 
         payload = {'DataPagamento': data_pagamento_norm}
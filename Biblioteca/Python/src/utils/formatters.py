@@ -119,14 +119,27 @@ def formatar_valor_monetario(valor: Union[str, float, int, Decimal, None]) -> st
     return f"R$ {inteiro_formatado},{centavos}"
 
 
-def interpretar_valor_monetario(valor: str) -> Optional[Decimal]:
-    """Converte string monetária brasileira em ``Decimal``."""
-    if not valor or not valor.strip():
-        return None
+# Separadores do formato brasileiro: milhar (.) some, decimal (,) vira ponto
+_TABELA_VALOR_MONETARIO = str.maketrans({' ': None, '.': None, ',': '.'})
+
 
-    convertido = valor.replace('R$', '').replace(' ', '').replace('.', '').replace(',', '.')
+def interpretar_valor_monetario(valor: Union[str, int, float, Decimal]) -> Decimal:
+    """Converte string monetária brasileira em ``Decimal``.
+
+    Raises:
+        ValueError: Se o valor estiver vazio, não for numérico ou não for finito.
+    """
+    if isinstance(valor, (int, float, Decimal)) and not isinstance(valor, bool):
+        texto = str(valor)
+    else:
+        texto = str(valor or '').strip().replace('R$', '').translate(_TABELA_VALOR_MONETARIO)
+    if not texto:
+        raise ValueError('Valor monetário vazio')
 
     try:
-        return Decimal(convertido)
-    except (InvalidOperation, ValueError):
-        return None
\ No newline at end of file
+        quantia = Decimal(texto)
+    except InvalidOperation as exc:
+        raise ValueError(f'Valor monetário inválido: {valor!r}') from exc
+    if not quantia.is_finite():
+        raise ValueError(f'Valor monetário inválido: {valor!r}')
+    return quantia
@@ -3,23 +3,35 @@
 Este pacote exporta apenas a interface "melhorada" (GUI atual).
 """
 
-from .componentes import TabelaResultados, criar_frame_entrada, mostrar_mensagem_padrao
+from importlib import import_module
 
-from .telas_consultas import (
-    tela_consulta_por_nome,
-    tela_consulta_por_estado,
-    tela_consulta_livro,
-)
+# Os submódulos de telas são carregados sob demanda (PEP 562): importar o
+# pacote não puxa todas as telas antes da primeira janela ser exibida.
+_ORIGEM = {
+    "TabelaResultados": "componentes",
+    "criar_frame_entrada": "componentes",
+    "mostrar_mensagem_padrao": "componentes",
+    "tela_consulta_por_nome": "telas_consultas",
+    "tela_consulta_por_estado": "telas_consultas",
+    "tela_consulta_livro": "telas_consultas",
+    "tela_cadastro_cliente": "telas_cadastro",
+    "tela_nova_reserva": "telas_reservas",
+    "tela_menu_multas": "telas_multas",
+    "tela_consultar_multas_por_cpf": "telas_multas",
+    "tela_listar_multas_pendentes": "telas_multas",
+    "tela_registrar_multa": "telas_multas",
+    "tela_registrar_pagamento": "telas_multas",
+}
+
+
+def __getattr__(nome):
+    modulo = _ORIGEM.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(import_module(f".{modulo}", __name__), nome)
+    globals()[nome] = valor
+    return valor
 
-from .telas_cadastro import tela_cadastro_cliente
-from .telas_reservas import tela_nova_reserva
-from .telas_multas import (
-    tela_menu_multas,
-    tela_consultar_multas_por_cpf,
-    tela_listar_multas_pendentes,
-    tela_registrar_multa,
-    tela_registrar_pagamento,
-)
 
 __all__ = [
     # Componentes Melhorados
@@ -7,10 +7,11 @@ como inputs, combobox, seletor de data, tabelas de resultados e helpers.
 import tkinter as tk
 from tkinter import ttk
 import customtkinter as ctk
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable
 from datetime import datetime, date, timedelta
 from src.utils.formatters import interpretar_data
 from src.config.settings import OPERATOR_PASSWORD
+from src.models.api_client import api_client as _cliente_api
 
 # Paleta e fontes padronizadas
 BACKGROUND_COLOR = "#0a0e27"
@@ -1022,3 +1023,48 @@ def criar_frame_info(parent, texto_inicial: str, icone: str = "ℹ️"):
     label.pack(pady=20, padx=20)
     
     return frame, label
+
+
+# Intervalo com que a thread do Tk verifica se a chamada em segundo plano terminou
+INTERVALO_VERIFICACAO_MS = 30
+
+
+def executar_em_segundo_plano(
+    widget,
+    funcao: Callable,
+    *args,
+    ao_concluir: Callable[[Any], None],
+    botao=None,
+) -> None:
+    """Executa ``funcao`` fora da thread do Tk e entrega o resultado via ``after``.
+
+    A chamada bloqueante roda no executor compartilhado do APIClient; a thread
+    do Tk consulta o futuro a cada INTERVALO_VERIFICACAO_MS (o Tkinter não pode
+    ser chamado de outras threads). ``widget`` deve pertencer à tela que fez a
+    chamada (ex.: o container dela): se a tela já foi trocada, o resultado é
+    descartado. ``botao``, se informado, fica desabilitado enquanto a chamada
+    está pendente.
+    """
+    if botao is not None:
+        botao.configure(state="disabled")
+    futuro = _cliente_api.executor.submit(funcao, *args)
+
+    def verificar() -> None:
+        try:
+            if not widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        if not futuro.done():
+            widget.after(INTERVALO_VERIFICACAO_MS, verificar)
+            return
+        if botao is not None:
+            botao.configure(state="normal")
+        try:
+            resultado = futuro.result()
+        except Exception as exc:  # noqa: BLE001 - erro exibido ao usuário
+            mostrar_mensagem_padrao("Erro", f"Erro inesperado: {exc}", "erro")
+            return
+        ao_concluir(resultado)
+
+    widget.after(INTERVALO_VERIFICACAO_MS, verificar)
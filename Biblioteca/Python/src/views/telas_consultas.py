@@ -6,6 +6,7 @@ import customtkinter as ctk
 from src.views.componentes import (
     TabelaResultados,
     criar_frame_entrada,
+    executar_em_segundo_plano,
     mostrar_mensagem_padrao,
 )
 
@@ -50,7 +51,16 @@ def tela_consulta_por_nome(janela: ctk.CTkFrame, api_client, callback_voltar):
             mostrar_mensagem_padrao("Atenção", "Digite um nome válido", "aviso")
             return
         
-        sucesso, dados, erro = api_client.buscar_cliente_por_nome(nome)
+        executar_em_segundo_plano(
+            container,
+            api_client.buscar_cliente_por_nome,
+            nome,
+            ao_concluir=lambda resultado: exibir_resultado(nome, resultado),
+            botao=btn_buscar,
+        )
+
+    def exibir_resultado(nome, resultado):
+        sucesso, dados, erro = resultado
         
         if sucesso:
             if not dados:
@@ -143,7 +153,16 @@ def tela_consulta_por_estado_melhorada(janela: ctk.CTkFrame, api_client, callbac
             mostrar_mensagem_padrao("Atenção", "Digite um estado válido", "aviso")
             return
         
-        sucesso, dados, erro = api_client.buscar_clientes_por_estado(estado)
+        executar_em_segundo_plano(
+            container,
+            api_client.buscar_clientes_por_estado,
+            estado,
+            ao_concluir=lambda resultado: exibir_resultado(estado, resultado),
+            botao=btn_buscar,
+        )
+
+    def exibir_resultado(estado, resultado):
+        sucesso, dados, erro = resultado
         
         if sucesso:
             if not dados:
@@ -295,11 +314,18 @@ def tela_consulta_livro_melhorada(janela: ctk.CTkFrame, api_client, callback_vol
         generos_disponiveis = set()
 
         def carregar_generos() -> None:
-            nonlocal generos_disponiveis
-
             status_genero.configure(text="Carregando gêneros do banco...", text_color="#a5b4fc")
+            executar_em_segundo_plano(
+                container,
+                api_client.listar_generos,
+                ao_concluir=aplicar_generos,
+                botao=btn_atualizar,
+            )
+
+        def aplicar_generos(resultado) -> None:
+            nonlocal generos_disponiveis
 
-            sucesso, generos, erro = api_client.listar_generos()
+            sucesso, generos, erro = resultado
             if not sucesso:
                 generos_disponiveis = set()
                 entry.configure(values=["(falha ao carregar)"])
@@ -370,7 +396,16 @@ def tela_consulta_livro_melhorada(janela: ctk.CTkFrame, api_client, callback_vol
                 )
                 return
         
-        sucesso, dados, erro = conf["funcao"](valor)
+        executar_em_segundo_plano(
+            container,
+            conf["funcao"],
+            valor,
+            ao_concluir=exibir_resultado,
+            botao=btn_buscar,
+        )
+
+    def exibir_resultado(resultado):
+        sucesso, dados, erro = resultado
         
         if sucesso:
             if not dados:
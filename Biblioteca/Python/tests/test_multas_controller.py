@@ -0,0 +1,24 @@
+"""Testes da interpretação de datas de multas."""
+
+from datetime import datetime
+
+from src.controllers.multas_controller import _interpretar_data_memo
+
+
+def test_ano_com_dois_digitos_vira_seculo_atual():
+    assert _interpretar_data_memo('01/02/24') == datetime(2024, 2, 1)
+
+
+def test_ano_com_quatro_digitos():
+    assert _interpretar_data_memo('01/02/2024') == datetime(2024, 2, 1)
+    assert _interpretar_data_memo('01/02/0024') == datetime(24, 2, 1)
+
+
+def test_formato_iso_da_api():
+    assert _interpretar_data_memo('2024-02-01') == datetime(2024, 2, 1)
+
+
+def test_data_invalida_ou_vazia():
+    assert _interpretar_data_memo('31/02/2024') is None
+    assert _interpretar_data_memo('') is None
+    assert _interpretar_data_memo(None) is None